@@ -11,6 +11,33 @@ logger = logging.getLogger(__name__)
 class FileProcessor:
     """Handles extraction of text from various file formats"""
     
+    # Vocabularies built once per class instead of on every call. Ordered
+    # tuples where results are listed in vocabulary order, frozensets where
+    # only any() of them matters.
+    _SKILLS_HEADERS = frozenset(['skills', 'technical skills', 'technologies', 'programming languages', 'tools'])
+    _SKILLS_TERMINATORS = frozenset(['experience', 'education', 'projects'])
+    _SKILLS = (
+        # Programming languages
+        'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin',
+        # Web technologies
+        'react', 'angular', 'vue', 'node.js', 'express', 'fastapi', 'django', 'flask', 'spring', 'html', 'css',
+        # Databases
+        'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite',
+        # Cloud/DevOps
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git',
+        # AI/ML
+        'machine learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
+        # Other
+        'linux', 'api', 'microservices', 'agile', 'scrum'
+    )
+    _EXP_KW = frozenset(['experience', 'work history', 'employment', 'professional experience'])
+    _EDU_KW = frozenset(['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd'])
+    _DEGREES = ('bachelor', 'master', 'phd', 'doctorate', 'associates', 'b.s.', 'm.s.', 'b.a.', 'm.a.')
+    _SECTIONS = (
+        'summary', 'objective', 'skills', 'experience', 'education', 'projects',
+        'certifications', 'awards', 'publications', 'languages'
+    )
+    
     def __init__(self):
         self.supported_types = {
             "application/pdf": self._extract_from_pdf,
@@ -177,42 +204,25 @@ class FileProcessor:
     
     def _extract_skills_section(self, text: str) -> Dict[str, Any]:
         """Extract skills section and categorize skills"""
-        skills_keywords = ['skills', 'technical skills', 'technologies', 'programming languages', 'tools']
-        
         # Find skills section
         skills_text = ""
         lines = text.lower().split('\n')
         
         in_skills_section = False
         for i, line in enumerate(lines):
-            if any(keyword in line for keyword in skills_keywords):
+            if any(keyword in line for keyword in self._SKILLS_HEADERS):
                 in_skills_section = True
                 continue
-            elif in_skills_section and (line.strip() == '' or any(keyword in line for keyword in ['experience', 'education', 'projects'])):
+            elif in_skills_section and (line.strip() == '' or any(keyword in line for keyword in self._SKILLS_TERMINATORS)):
                 break
             elif in_skills_section:
                 skills_text += line + " "
         
         # Extract individual skills
-        common_skills = [
-            # Programming languages
-            'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin',
-            # Web technologies
-            'react', 'angular', 'vue', 'node.js', 'express', 'fastapi', 'django', 'flask', 'spring', 'html', 'css',
-            # Databases
-            'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite',
-            # Cloud/DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git',
-            # AI/ML
-            'machine learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            # Other
-            'linux', 'api', 'microservices', 'agile', 'scrum'
-        ]
-        
         found_skills = []
         text_lower = (skills_text + " " + text).lower()
         
-        for skill in common_skills:
+        for skill in self._SKILLS:
             if skill in text_lower:
                 found_skills.append(skill)
         
@@ -224,37 +234,27 @@ class FileProcessor:
     
     def _extract_experience_section(self, text: str) -> Dict[str, Any]:
         """Extract work experience information"""
-        experience_keywords = ['experience', 'work history', 'employment', 'professional experience']
-        
         # This is a simplified version - could be enhanced with NLP
         return {
-            "has_experience_section": any(keyword in text.lower() for keyword in experience_keywords),
+            "has_experience_section": any(keyword in text.lower() for keyword in self._EXP_KW),
             "years_pattern_found": bool(re.search(r'\d+\+?\s*years?', text.lower())),
             "company_patterns": len(re.findall(r'\b(?:inc|llc|corp|company|ltd)\b', text.lower()))
         }
     
     def _extract_education_section(self, text: str) -> Dict[str, Any]:
         """Extract education information"""
-        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
-        degrees = ['bachelor', 'master', 'phd', 'doctorate', 'associates', 'b.s.', 'm.s.', 'b.a.', 'm.a.']
-        
         return {
-            "has_education_section": any(keyword in text.lower() for keyword in education_keywords),
-            "degrees_mentioned": [degree for degree in degrees if degree in text.lower()],
+            "has_education_section": any(keyword in text.lower() for keyword in self._EDU_KW),
+            "degrees_mentioned": [degree for degree in self._DEGREES if degree in text.lower()],
             "graduation_years": re.findall(r'\b(19|20)\d{2}\b', text)
         }
     
     def _identify_sections(self, text: str) -> List[str]:
         """Identify main resume sections"""
-        common_sections = [
-            'summary', 'objective', 'skills', 'experience', 'education', 'projects', 
-            'certifications', 'awards', 'publications', 'languages'
-        ]
-        
         found_sections = []
         text_lower = text.lower()
         
-        for section in common_sections:
+        for section in self._SECTIONS:
             if section in text_lower:
                 found_sections.append(section)
         
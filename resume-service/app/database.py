@@ -1,6 +1,6 @@
 # resume-service/app/database.py
 import os
-from sqlalchemy import create_engine, Column, String, Text, Integer, Boolean, DateTime, Float, JSON, ForeignKey, Index
+from sqlalchemy import create_engine, text, Column, String, Text, Integer, Boolean, DateTime, Float, JSON, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
@@ -28,6 +28,9 @@ engine = create_engine(
     echo=os.getenv("DB_ECHO", "false").lower() == "true"
 )
 
+# Upper bound for the health check query on Postgres
+HEALTH_STATEMENT_TIMEOUT = "500ms"
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -64,7 +67,10 @@ def check_db_connection() -> bool:
     """Check database connection"""
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
+            if engine.dialect.name == "postgresql":
+                # Scoped to the implicit transaction, so it never leaks back into the pool
+                connection.execute(text(f"SET LOCAL statement_timeout = '{HEALTH_STATEMENT_TIMEOUT}'"))
+            connection.execute(text("SELECT 1"))
         return True
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
@@ -79,14 +85,14 @@ def get_db_stats() -> dict:
             stats = {}
             
             for table in tables:
-                result = connection.execute(f"SELECT COUNT(*) FROM {table}")
+                result = connection.execute(text(f"SELECT COUNT(*) FROM {table}"))
                 count = result.scalar()
                 stats[f"{table}_count"] = count
             
             # Get database size
-            result = connection.execute("""
+            result = connection.execute(text("""
                 SELECT pg_size_pretty(pg_database_size(current_database())) as db_size
-            """)
+            """))
             stats['database_size'] = result.scalar()
             
             return stats
@@ -95,6 +101,25 @@ def get_db_stats() -> dict:
         logger.error(f"Failed to get database stats: {e}")
         return {"error": str(e)}
 
+def get_storage_stats() -> dict:
+    """Get the number and total size of stored files from the resume tables"""
+    try:
+        with engine.connect() as connection:
+            files_count, total_size = connection.execute(text("""
+                SELECT COUNT(*), COALESCE(SUM(file_size), 0) FROM (
+                    SELECT file_size FROM resumes WHERE storage_key IS NOT NULL
+                    UNION ALL
+                    SELECT file_size FROM resume_versions WHERE storage_key IS NOT NULL
+                ) AS stored_files
+            """)).one()
+            
+            # SUM over an integer column is NUMERIC (Decimal) on PostgreSQL
+            return {"files_count": files_count, "total_size": int(total_size)}
+            
+    except Exception as e:
+        logger.error(f"Failed to get storage stats: {e}")
+        return {"error": str(e)}
+
 class DatabaseManager:
     """Database management utilities"""
     
@@ -240,13 +265,10 @@ def health_check() -> dict:
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        # Get basic stats
-        stats = get_db_stats()
-        
+        # Table counts and sizes are served by /metrics; keep the probe to the timed ping
         return {
             "status": "healthy",
             "database": "connected",
-            "stats": stats,
             "timestamp": datetime.utcnow().isoformat()
         }
         
@@ -0,0 +1,10 @@
+"""
+Shared FastAPI dependencies for the Resume Service
+"""
+from fastapi import Request
+
+from .services.storage_service import StorageService
+
+def get_storage(request: Request) -> StorageService:
+    """Return the StorageService opened during startup"""
+    return request.app.state.storage
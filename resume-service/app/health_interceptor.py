@@ -0,0 +1,29 @@
+# resume-service/app/health_interceptor.py
+# Liveness paths answered before the FastAPI middleware and router stack
+LIVENESS_PATHS = frozenset({"/health", "/healthz"})
+
+_OK_BODY = b'{"status":"ok"}'
+_OK_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_OK_BODY)).encode()),
+]
+
+class HealthCheckInterceptor:
+    """Pure ASGI wrapper that answers liveness probes without touching the app"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in LIVENESS_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 405, "headers": [(b"allow", b"GET, HEAD")]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        await send({"type": "http.response.start", "status": 200, "headers": _OK_HEADERS})
+        await send({"type": "http.response.body", "body": _OK_BODY if method == "GET" else b""})
@@ -0,0 +1,7 @@
+# resume-service/app/queue_config.py
+import os
+
+from arq.connections import RedisSettings
+
+# Redis connection shared by the API (enqueue) and the worker (consume)
+REDIS_SETTINGS = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
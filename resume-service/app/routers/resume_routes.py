@@ -1,11 +1,19 @@
 # resume-service/app/routers/resume_routes.py
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+from typing import AsyncIterator, List, Optional
+from pydantic import TypeAdapter
 import logging
+import uuid
 from datetime import datetime
+from urllib.parse import quote
+from botocore.exceptions import ClientError
 
 from ..database import get_db
+from ..dependencies import get_storage
 from ..models.schemas import (
     ResumeResponse, ResumeListResponse, ResumeUploadRequest, ResumeUploadResponse,
     ResumeUpdate, ResumeVersionResponse, ResumeVersionListResponse,
@@ -23,7 +31,104 @@ router = APIRouter(prefix="/resumes", tags=["Resume Management"])
 
 # Initialize services
 resume_service = ResumeService()
-storage_service = StorageService()
+
+# Validators for list responses, built once at import instead of per request
+_resume_list_adapter = TypeAdapter(List[ResumeResponse])
+_version_list_adapter = TypeAdapter(List[ResumeVersionResponse])
+_optimization_list_adapter = TypeAdapter(List[ResumeOptimizationResponse])
+_analysis_list_adapter = TypeAdapter(List[ResumeAnalysisResponse])
+
+# Maximum accepted upload size (10MB)
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# Canonical (file_type, mime_type) per accepted extension; client content types are not trusted
+_EXT_META = {
+    "pdf": ("pdf", "application/pdf"),
+    "docx": ("docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "txt": ("txt", "text/plain"),
+    "jpg": ("jpg", "image/jpeg"),
+    "jpeg": ("jpg", "image/jpeg"),
+    "png": ("png", "image/png"),
+}
+
+# Short private caching lets proxies revalidate with If-None-Match
+CACHE_CONTROL = "private, max-age=10"
+
+def _resume_etag(resume: Resume) -> str:
+    """Build a weak ETag from a resume's id and last update time"""
+    updated = int(resume.updated_at.timestamp()) if resume.updated_at else 0
+    return f'W/"{resume.id}-{updated}"'
+
+def _check_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set caching headers and return a 304 response if the client copy is current"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+async def _open_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Pull the first chunk now so a missing object fails before the response starts"""
+    try:
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        first = b""
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            raise HTTPException(status_code=404, detail="File not found")
+        raise
+
+    async def rest() -> AsyncIterator[bytes]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return rest()
+
+def _upload_size(file: UploadFile) -> int:
+    """Get upload size from the spooled temp file without reading its content"""
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, 2)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+async def _enqueue_processing(
+    request: Request,
+    background_tasks: Optional[BackgroundTasks],
+    db: Session,
+    job_name: str,
+    record_id
+):
+    """Queue a processing job for the arq worker, falling back to in-process tasks"""
+    arq_pool = getattr(request.app.state, "arq_pool", None)
+    if arq_pool is not None:
+        await arq_pool.enqueue_job(job_name, str(record_id))
+    elif background_tasks:
+        background_tasks.add_task(getattr(resume_service, job_name), db, record_id)
+
+def _is_owner(resume: Optional[Resume], user_id: str) -> bool:
+    """Compare ownership as UUIDs, so uppercase or braced IDs from callers still match"""
+    if resume is None:
+        return False
+    try:
+        return resume.user_id == uuid.UUID(user_id)
+    except ValueError:
+        return False
+
+def owned_resume(
+    resume_id: str,
+    user_id: str = Query(..., description="User ID"),
+    db: Session = Depends(get_db)
+) -> Resume:
+    """Resolve a resume owned by the user; FastAPI caches this per request"""
+    resume = resume_service.get_resume(db, resume_id, user_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return resume
 
 # Resume Management Routes
 @router.post("/upload", response_model=ResumeUploadResponse)
@@ -39,17 +144,19 @@ async def upload_resume(
         if not file.filename:
             raise HTTPException(status_code=400, detail="No file provided")
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate file size (10MB limit)
-        if len(file_content) > 10 * 1024 * 1024:
+        # Validate file size (10MB limit) before reading anything into memory
+        file_size = _upload_size(file)
+        if file_size > MAX_UPLOAD_SIZE:
             raise HTTPException(status_code=400, detail="File size must be less than 10MB")
         
         # Determine file type
-        file_type = file.filename.split('.')[-1].lower()
-        if file_type not in ['pdf', 'docx', 'txt', 'jpg', 'jpeg', 'png']:
+        meta = _EXT_META.get(file.filename.rpartition('.')[2].lower())
+        if not meta:
             raise HTTPException(status_code=400, detail="Unsupported file type")
+        file_type, mime_type = meta
+        
+        # Read file content
+        file_content = await file.read()
         
         # Create resume upload request
         from ..models.schemas import ResumeCreate, FileType, StorageProvider
@@ -57,8 +164,8 @@ async def upload_resume(
             user_id=user_id,
             filename=file.filename,
             file_type=FileType(file_type),
-            file_size=len(file_content),
-            mime_type=file.content_type or "application/octet-stream",
+            file_size=file_size,
+            mime_type=mime_type,
             is_public=is_public
         )
         
@@ -73,12 +180,16 @@ async def upload_resume(
             status="completed"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Failed to upload resume: {e}")
-        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+        logger.exception("Failed to upload resume: %s", e)
+        raise HTTPException(status_code=500, detail="Upload failed")
 
 @router.get("/", response_model=ResumeListResponse)
 async def list_resumes(
+    request: Request,
+    response: Response,
     user_id: str = Query(..., description="User ID"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -86,10 +197,20 @@ async def list_resumes(
 ):
     """Get all resumes for a user"""
     try:
+        # One aggregate query decides whether the list changed
+        last_updated, row_count = db.query(
+            func.max(Resume.updated_at), func.count(Resume.id)
+        ).filter(Resume.user_id == user_id).one()
+        updated = int(last_updated.timestamp()) if last_updated else 0
+        etag = f'W/"{user_id}-{updated}-{row_count}-{skip}-{limit}"'
+        not_modified = _check_etag(request, response, etag)
+        if not_modified:
+            return not_modified
+        
         resumes = resume_service.get_user_resumes(db, user_id, skip, limit)
         
         return ResumeListResponse(
-            resumes=[ResumeResponse.from_orm(resume) for resume in resumes],
+            resumes=_resume_list_adapter.validate_python(resumes, from_attributes=True),
             total_count=len(resumes),
             page=skip // limit + 1,
             page_size=limit,
@@ -97,28 +218,29 @@ async def list_resumes(
         )
         
     except Exception as e:
-        logger.error(f"Failed to list resumes: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to list resumes: {str(e)}")
+        logger.exception("Failed to list resumes: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to list resumes")
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: str,
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    resume: Resume = Depends(owned_resume)
 ):
     """Get a specific resume by ID"""
     try:
-        resume = resume_service.get_resume(db, resume_id, user_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
+        not_modified = _check_etag(request, response, _resume_etag(resume))
+        if not_modified:
+            return not_modified
         
-        return ResumeResponse.from_orm(resume)
+        return ResumeResponse.model_validate(resume, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get resume {resume_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get resume: {str(e)}")
+        logger.exception("Failed to get resume %s: %s", resume_id, e)
+        raise HTTPException(status_code=500, detail="Failed to get resume")
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
 async def update_resume(
@@ -133,13 +255,13 @@ async def update_resume(
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        return ResumeResponse.from_orm(resume)
+        return ResumeResponse.model_validate(resume, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update resume {resume_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update resume: {str(e)}")
+        logger.exception("Failed to update resume %s: %s", resume_id, e)
+        raise HTTPException(status_code=500, detail="Failed to update resume")
 
 @router.delete("/{resume_id}", response_model=BaseResponse)
 async def delete_resume(
@@ -160,8 +282,8 @@ async def delete_resume(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete resume {resume_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to delete resume: {str(e)}")
+        logger.exception("Failed to delete resume %s: %s", resume_id, e)
+        raise HTTPException(status_code=500, detail="Failed to delete resume")
 
 # Resume Version Routes
 @router.post("/{resume_id}/versions", response_model=ResumeVersionResponse)
@@ -174,13 +296,17 @@ async def create_resume_version(
 ):
     """Create a new version of a resume"""
     try:
+        # Validate file size before reading anything into memory
+        if _upload_size(file) > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=400, detail="File size must be less than 10MB")
+        
+        # Validate file type
+        if not file.filename or file.filename.rpartition('.')[2].lower() not in _EXT_META:
+            raise HTTPException(status_code=400, detail="Unsupported file type")
+        
         # Read file content
         file_content = await file.read()
         
-        # Validate file size
-        if len(file_content) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File size must be less than 10MB")
-        
         # Create version
         version = await resume_service.create_resume_version(
             db, resume_id, user_id, file_content, file.filename, version_reason
@@ -189,13 +315,13 @@ async def create_resume_version(
         if not version:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        return ResumeVersionResponse.from_orm(version)
+        return ResumeVersionResponse.model_validate(version, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create resume version: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create version: {str(e)}")
+        logger.exception("Failed to create resume version: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to create version")
 
 @router.get("/{resume_id}/versions", response_model=ResumeVersionListResponse)
 async def list_resume_versions(
@@ -208,20 +334,21 @@ async def list_resume_versions(
         versions = resume_service.get_resume_versions(db, resume_id, user_id)
         
         return ResumeVersionListResponse(
-            versions=[ResumeVersionResponse.from_orm(version) for version in versions],
+            versions=_version_list_adapter.validate_python(versions, from_attributes=True),
             total_count=len(versions),
             resume_id=resume_id
         )
         
     except Exception as e:
-        logger.error(f"Failed to list resume versions: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to list versions: {str(e)}")
+        logger.exception("Failed to list resume versions: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to list versions")
 
 # Resume Optimization Routes
 @router.post("/{resume_id}/optimize", response_model=ResumeOptimizationResponse)
 async def create_resume_optimization(
     resume_id: str,
     optimization_data: ResumeOptimizationRequest,
+    request: Request,
     user_id: str = Query(..., description="User ID"),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
@@ -237,19 +364,18 @@ async def create_resume_optimization(
         if not optimization:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Add background task to process optimization
-        if background_tasks:
-            background_tasks.add_task(
-                resume_service.process_resume_optimization, db, optimization.id
-            )
+        # Hand processing off to the worker queue
+        await _enqueue_processing(
+            request, background_tasks, db, "process_resume_optimization", optimization.id
+        )
         
-        return ResumeOptimizationResponse.from_orm(optimization)
+        return ResumeOptimizationResponse.model_validate(optimization, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create optimization: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create optimization: {str(e)}")
+        logger.exception("Failed to create optimization: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to create optimization")
 
 @router.get("/{resume_id}/optimizations", response_model=ResumeOptimizationListResponse)
 async def list_resume_optimizations(
@@ -262,14 +388,14 @@ async def list_resume_optimizations(
         optimizations = resume_service.get_resume_optimizations(db, resume_id, user_id)
         
         return ResumeOptimizationListResponse(
-            optimizations=[ResumeOptimizationResponse.from_orm(opt) for opt in optimizations],
+            optimizations=_optimization_list_adapter.validate_python(optimizations, from_attributes=True),
             total_count=len(optimizations),
             resume_id=resume_id
         )
         
     except Exception as e:
-        logger.error(f"Failed to list optimizations: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to list optimizations: {str(e)}")
+        logger.exception("Failed to list optimizations: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to list optimizations")
 
 @router.get("/optimizations/{optimization_id}", response_model=ResumeOptimizationResponse)
 async def get_optimization(
@@ -279,7 +405,10 @@ async def get_optimization(
 ):
     """Get a specific optimization by ID"""
     try:
-        optimization = db.query(ResumeOptimization).filter(
+        # Eager-load the parent resume so the ownership check needs no second query
+        optimization = db.query(ResumeOptimization).options(
+            joinedload(ResumeOptimization.resume)
+        ).filter(
             ResumeOptimization.id == optimization_id
         ).first()
         
@@ -287,23 +416,23 @@ async def get_optimization(
             raise HTTPException(status_code=404, detail="Optimization not found")
         
         # Verify user owns the resume
-        resume = resume_service.get_resume(db, optimization.resume_id, user_id)
-        if not resume:
+        if not _is_owner(optimization.resume, user_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return ResumeOptimizationResponse.from_orm(optimization)
+        return ResumeOptimizationResponse.model_validate(optimization, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get optimization {optimization_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get optimization: {str(e)}")
+        logger.exception("Failed to get optimization %s: %s", optimization_id, e)
+        raise HTTPException(status_code=500, detail="Failed to get optimization")
 
 # Resume Analysis Routes
 @router.post("/{resume_id}/analyze", response_model=ResumeAnalysisResponse)
 async def create_resume_analysis(
     resume_id: str,
     analysis_data: ResumeAnalysisRequest,
+    request: Request,
     user_id: str = Query(..., description="User ID"),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
@@ -319,19 +448,18 @@ async def create_resume_analysis(
         if not analysis:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Add background task to process analysis
-        if background_tasks:
-            background_tasks.add_task(
-                resume_service.process_resume_analysis, db, analysis.id
-            )
+        # Hand processing off to the worker queue
+        await _enqueue_processing(
+            request, background_tasks, db, "process_resume_analysis", analysis.id
+        )
         
-        return ResumeAnalysisResponse.from_orm(analysis)
+        return ResumeAnalysisResponse.model_validate(analysis, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create analysis: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create analysis: {str(e)}")
+        logger.exception("Failed to create analysis: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to create analysis")
 
 @router.get("/{resume_id}/analyses", response_model=ResumeAnalysisListResponse)
 async def list_resume_analyses(
@@ -344,14 +472,14 @@ async def list_resume_analyses(
         analyses = resume_service.get_resume_analyses(db, resume_id, user_id)
         
         return ResumeAnalysisListResponse(
-            analyses=[ResumeAnalysisResponse.from_orm(analysis) for analysis in analyses],
+            analyses=_analysis_list_adapter.validate_python(analyses, from_attributes=True),
             total_count=len(analyses),
             resume_id=resume_id
         )
         
     except Exception as e:
-        logger.error(f"Failed to list analyses: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to list analyses: {str(e)}")
+        logger.exception("Failed to list analyses: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to list analyses")
 
 @router.get("/analyses/{analysis_id}", response_model=ResumeAnalysisResponse)
 async def get_analysis(
@@ -361,7 +489,10 @@ async def get_analysis(
 ):
     """Get a specific analysis by ID"""
     try:
-        analysis = db.query(ResumeAnalysis).filter(
+        # Eager-load the parent resume so the ownership check needs no second query
+        analysis = db.query(ResumeAnalysis).options(
+            joinedload(ResumeAnalysis.resume)
+        ).filter(
             ResumeAnalysis.id == analysis_id
         ).first()
         
@@ -369,30 +500,30 @@ async def get_analysis(
             raise HTTPException(status_code=404, detail="Analysis not found")
         
         # Verify user owns the resume
-        resume = resume_service.get_resume(db, analysis.resume_id, user_id)
-        if not resume:
+        if not _is_owner(analysis.resume, user_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return ResumeAnalysisResponse.from_orm(analysis)
+        return ResumeAnalysisResponse.model_validate(analysis, from_attributes=True)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get analysis {analysis_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get analysis: {str(e)}")
+        logger.exception("Failed to get analysis %s: %s", analysis_id, e)
+        raise HTTPException(status_code=500, detail="Failed to get analysis")
 
 # Processing Status Routes
 @router.get("/{resume_id}/status", response_model=ProcessingStatusResponse)
 async def get_processing_status(
     resume_id: str,
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    resume: Resume = Depends(owned_resume)
 ):
     """Get processing status for a resume"""
     try:
-        resume = resume_service.get_resume(db, resume_id, user_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
+        not_modified = _check_etag(request, response, _resume_etag(resume))
+        if not_modified:
+            return not_modified
         
         return ProcessingStatusResponse(
             resume_id=resume_id,
@@ -403,8 +534,8 @@ async def get_processing_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get processing status: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
+        logger.exception("Failed to get processing status: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to get status")
 
 # Statistics Routes
 @router.get("/stats/user/{user_id}")
@@ -418,24 +549,20 @@ async def get_user_resume_stats(
         return stats
         
     except Exception as e:
-        logger.error(f"Failed to get user stats: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
+        logger.exception("Failed to get user stats: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to get stats")
 
 # File Download Routes
 @router.get("/{resume_id}/download")
 async def download_resume(
     resume_id: str,
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    resume: Resume = Depends(owned_resume),
+    storage: StorageService = Depends(get_storage)
 ):
     """Download resume file"""
     try:
-        resume = resume_service.get_resume(db, resume_id, user_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
-        
         # Generate presigned URL for download
-        download_url = storage_service.generate_presigned_url(resume.storage_key, expiration=3600)
+        download_url = await storage.generate_presigned_url(resume.storage_key, expiration=3600)
         
         return {
             "download_url": download_url,
@@ -446,34 +573,51 @@ async def download_resume(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to generate download URL: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate download URL: {str(e)}")
+        logger.exception("Failed to generate download URL: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to generate download URL")
+
+@router.get("/{resume_id}/stream")
+async def stream_resume(
+    resume_id: str,
+    resume: Resume = Depends(owned_resume),
+    storage: StorageService = Depends(get_storage)
+):
+    """Stream resume file directly instead of returning a presigned URL"""
+    try:
+        body = await _open_stream(storage.stream_file(resume.storage_key))
+        return StreamingResponse(
+            body,
+            media_type=resume.mime_type,
+            headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(resume.filename)}"}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to stream resume %s: %s", resume_id, e)
+        raise HTTPException(status_code=500, detail="Failed to stream resume")
 
 @router.get("/{resume_id}/versions/{version_id}/download")
 async def download_resume_version(
     resume_id: str,
     version_id: str,
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    resume: Resume = Depends(owned_resume),
+    db: Session = Depends(get_db),
+    storage: StorageService = Depends(get_storage)
 ):
     """Download a specific resume version"""
     try:
-        # Verify user owns the resume
-        resume = resume_service.get_resume(db, resume_id, user_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
-        
         # Get version
         version = db.query(ResumeVersion).filter(
             ResumeVersion.id == version_id,
-            ResumeVersion.resume_id == resume_id
+            ResumeVersion.resume_id == resume.id
         ).first()
         
         if not version:
             raise HTTPException(status_code=404, detail="Version not found")
         
         # Generate presigned URL for download
-        download_url = storage_service.generate_presigned_url(version.storage_key, expiration=3600)
+        download_url = await storage.generate_presigned_url(version.storage_key, expiration=3600)
         
         return {
             "download_url": download_url,
@@ -485,8 +629,8 @@ async def download_resume_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to generate version download URL: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate download URL: {str(e)}")
+        logger.exception("Failed to generate version download URL: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to generate download URL")
 
 
 
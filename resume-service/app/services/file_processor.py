@@ -2,17 +2,272 @@
 import fitz  # PyMuPDF for PDF processing
 from docx import Document  # python-docx for DOCX processing
 import io
+import os
+import asyncio
+import codecs
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 import re
 import logging
 from PIL import Image
 import pytesseract
 import cv2
+import ahocorasick
 import numpy as np
 from datetime import datetime
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every processed resume
+WHITESPACE_RE = re.compile(r'\s+')
+ALLOWED_CHAR_RE = re.compile(r'[\w\s\.,;:()\-@/]')
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RES = (
+    re.compile(r'(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # US format
+    re.compile(r'\+?[\d\s\-\(\)]{10,}'),  # International format
+    re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')  # Simple format
+)
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_RE = re.compile(r'github\.com/[\w-]+')
+WEBSITE_RE = re.compile(r'https?://(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/\S*)?')
+
+YEARS_RE = re.compile(r'\d+\+?\s*years?')
+COMPANY_RE = re.compile(r'\b(?:inc|llc|corp|company|ltd|tech|solutions|systems)\b')
+GRADUATION_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+
+TEXT_ENCODINGS = ('utf-8', 'utf-16', 'cp1252', 'iso-8859-1')
+
+# Checked in order: the UTF-32 LE mark starts with the UTF-16 LE one
+TEXT_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+
+# Plain-text PDF extraction without ligature preservation, so "ﬁ" comes out as "fi"
+PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+MAX_FILE_BYTES = 20 * 1024 * 1024
+
+# Magic bytes -> content type; DOCX is a zip container
+FILE_SIGNATURES = (
+    (b'%PDF', "application/pdf"),
+    (b'PK\x03\x04', "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    (b'\x89PNG\r\n\x1a\n', "image/png"),
+    (b'\xff\xd8\xff', "image/jpeg")
+)
+
+# Render resolution for OCR'd PDF pages
+OCR_DPI = 300
+
+# Images whose longest side is under OCR_UPSCALE_BELOW px are upscaled before OCR
+OCR_UPSCALE_BELOW = 1000
+OCR_UPSCALE_FACTOR = 3
+
+class _CleanTextTable(dict):
+    """str.translate table that drops disallowed characters, filled lazily per codepoint"""
+    
+    def __missing__(self, codepoint: int):
+        value = codepoint if ALLOWED_CHAR_RE.match(chr(codepoint)) else None
+        self[codepoint] = value
+        return value
+
+# Bullets become dashes; everything outside [\w\s.,;:()\-@/] is removed
+CLEAN_TEXT_TABLE = _CleanTextTable({ord('•'): '-'})
+
+# One alternation so job titles are found in a single pass over the text
+JOB_TITLE_RE = re.compile(
+    r'(?:senior|junior|lead|principal|staff)?\s*(?:software engineer|developer|programmer|architect|manager|director|consultant)'
+    r'|(?:full stack|front end|back end|devops|data|machine learning|ai|ml)\s*(?:engineer|developer)'
+    r'|(?:product|project|program|engineering)\s*(?:manager|director|lead)'
+)
+ACHIEVEMENT_RES = (
+    re.compile(r'(?:increased|improved|reduced|achieved|delivered|led|managed|developed|created|implemented).*?(?:by \d+%|\d+%|\d+x|\d+ times)', re.IGNORECASE),
+    re.compile(r'(?:awarded|recognized|honored|received).*?(?:award|recognition|honor)', re.IGNORECASE),
+    re.compile(r'(?:successfully|effectively|efficiently).*?(?:completed|delivered|implemented)', re.IGNORECASE)
+)
+
+# Keyword vocabularies matched as plain substrings of the lowercased resume
+COMMON_SKILLS = (
+    # Programming languages
+    'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin', 'scala',
+    # Web technologies
+    'react', 'angular', 'vue', 'node.js', 'express', 'fastapi', 'django', 'flask', 'spring', 'html', 'css', 'sass', 'less',
+    # Databases
+    'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server',
+    # Cloud/DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab', 'ci/cd',
+    # AI/ML
+    'machine learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn',
+    # Other
+    'linux', 'api', 'microservices', 'agile', 'scrum', 'jira', 'confluence', 'slack', 'figma', 'adobe'
+)
+SKILL_CATEGORIES = {
+    "programming_languages": ('python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin', 'scala'),
+    "frameworks": ('react', 'angular', 'vue', 'express', 'fastapi', 'django', 'flask', 'spring'),
+    "databases": ('postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server'),
+    "cloud_platforms": ('aws', 'azure', 'gcp'),
+    "tools": ('docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab', 'jira', 'figma'),
+    "methodologies": ('agile', 'scrum', 'microservices', 'ci/cd')
+}
+COMMON_SECTIONS = (
+    'summary', 'objective', 'skills', 'experience', 'education', 'projects',
+    'certifications', 'awards', 'publications', 'languages', 'volunteer',
+    'interests', 'references'
+)
+EXPERIENCE_KEYWORDS = ('experience', 'work history', 'employment', 'professional experience', 'work experience')
+EDUCATION_KEYWORDS = ('education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd')
+DEGREES = ('bachelor', 'master', 'phd', 'doctorate', 'associates', 'b.s.', 'm.s.', 'b.a.', 'm.a.', 'b.tech', 'm.tech')
+
+UNIVERSITY_KEYWORDS = ('university', 'college', 'institute', 'school')
+
+# Section -> (header keywords that open it, keywords that close it); a blank line also closes it
+SECTION_BOUNDARIES = {
+    "skills": (
+        ('skills', 'technical skills', 'technologies', 'programming languages', 'tools', 'competencies'),
+        ('experience', 'education', 'projects', 'work history')
+    ),
+    "experience": (
+        EXPERIENCE_KEYWORDS,
+        ('education', 'projects', 'skills')
+    )
+}
+
+# First category wins, matching the original list scan
+SKILL_TO_CATEGORY = {}
+for _category, _skills in SKILL_CATEGORIES.items():
+    for _skill in _skills:
+        SKILL_TO_CATEGORY.setdefault(_skill, _category)
+
+KEYWORD_BUCKETS = {
+    "skills": COMMON_SKILLS,
+    "sections": COMMON_SECTIONS,
+    "experience": EXPERIENCE_KEYWORDS,
+    "education": EDUCATION_KEYWORDS,
+    "degrees": DEGREES
+}
+
+def _index_keywords() -> tuple:
+    """Pair every distinct keyword with the buckets it belongs to"""
+    buckets_by_keyword: Dict[str, set] = {}
+    for bucket, keywords in KEYWORD_BUCKETS.items():
+        for keyword in keywords:
+            buckets_by_keyword.setdefault(keyword, set()).add(bucket)
+    return tuple((keyword, frozenset(buckets)) for keyword, buckets in buckets_by_keyword.items())
+
+KEYWORD_INDEX = _index_keywords()
+
+def _build_keyword_automaton() -> "ahocorasick.Automaton":
+    """Build one Aho-Corasick automaton over every keyword bucket"""
+    automaton = ahocorasick.Automaton()
+    for keyword, buckets in KEYWORD_INDEX:
+        automaton.add_word(keyword, (keyword, buckets))
+    automaton.make_automaton()
+    return automaton
+
+def _build_keyword_database() -> Optional["hyperscan.Database"]:
+    """Compile the keywords into a Hyperscan database, or None when Hyperscan can't be used"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode() for keyword, _ in KEYWORD_INDEX],
+            ids=list(range(len(KEYWORD_INDEX))),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, using Aho-Corasick for keyword matching: {e}")
+        return None
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+KEYWORD_DATABASE = _build_keyword_database()
+
+# Hyperscan scratch space is per scan, so each extraction thread keeps its own
+_scratch = threading.local()
+
+def _hyperscan_keywords(text_lower: str):
+    """Keyword entries found by Hyperscan; SINGLEMATCH reports each keyword once"""
+    scratch = getattr(_scratch, "space", None)
+    if scratch is None:
+        scratch = _scratch.space = hyperscan.Scratch(KEYWORD_DATABASE)
+    
+    found = set()
+    KEYWORD_DATABASE.scan(
+        text_lower.encode("utf-8"),
+        match_event_handler=lambda keyword_id, start, end, flags, context: found.add(keyword_id),
+        scratch=scratch
+    )
+    return (KEYWORD_INDEX[keyword_id] for keyword_id in found)
+
+def _scan_keywords(text_lower: str) -> Dict[str, set]:
+    """Find every vocabulary keyword in one pass, grouped by bucket"""
+    hits: Dict[str, set] = {bucket: set() for bucket in KEYWORD_BUCKETS}
+    if KEYWORD_DATABASE is not None:
+        matches = _hyperscan_keywords(text_lower)
+    else:
+        matches = (entry for _, entry in KEYWORD_AUTOMATON.iter(text_lower))
+    
+    for keyword, buckets in matches:
+        for bucket in buckets:
+            hits[bucket].add(keyword)
+    return hits
+
+# Sauvola local thresholding for unevenly lit scans and photos
+SAUVOLA_WINDOW = 25
+SAUVOLA_K = 0.2
+# Std-dev of the page shrunk to 32x32: text on paper stays low, shadows and gradients push it up
+UNEVEN_ILLUMINATION_STD = 30.0
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _sauvola_threshold(gray, integral, integral_sq, window, k):
+        """Binarize with Sauvola thresholds from (h+1, w+1) integral images"""
+        height, width = gray.shape
+        half = window // 2
+        out = np.empty((height, width), np.uint8)
+        for y in numba.prange(height):
+            y0 = max(0, y - half)
+            y1 = min(height, y + half + 1)
+            for x in range(width):
+                x0 = max(0, x - half)
+                x1 = min(width, x + half + 1)
+                count = (y1 - y0) * (x1 - x0)
+                total = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+                total_sq = integral_sq[y1, x1] - integral_sq[y0, x1] - integral_sq[y1, x0] + integral_sq[y0, x0]
+                mean = total / count
+                std = np.sqrt(max(total_sq / count - mean * mean, 0.0))
+                threshold = mean * (1.0 + k * (std / 128.0 - 1.0))
+                out[y, x] = 255 if gray[y, x] > threshold else 0
+        return out
+
+# PyMuPDF is not thread-safe, so only one extraction thread may use it at a time
+_FITZ_LOCK = threading.Lock()
+
+# Worker threads for blocking document extraction
+_EXTRACT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="resume-extract")
+
 class FileProcessor:
     """Enhanced file processor with cloud storage integration"""
     
@@ -28,7 +283,19 @@ class FileProcessor:
     
     async def extract_text(self, content: bytes, content_type: str, filename: str = "") -> Dict[str, Any]:
         """Extract text from uploaded file with enhanced processing"""
+        # Parsing, OCR and OpenCV all block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_EXTRACT_POOL, self._extract_text_sync, content, content_type, filename)
+    
+    def _extract_text_sync(self, content: bytes, content_type: str, filename: str) -> Dict[str, Any]:
+        """Blocking body of extract_text, run on the extraction pool"""
         try:
+            # Cheapest checks first, before any parser sees the bytes
+            if len(content) > MAX_FILE_BYTES:
+                raise ValueError(f"File too large: {len(content)} bytes (max {MAX_FILE_BYTES})")
+            
+            # Trust the file signature over a mislabeled Content-Type header
+            content_type = self._sniff_content_type(content) or content_type
             if content_type not in self.supported_types:
                 raise ValueError(f"Unsupported file type: {content_type}")
             
@@ -56,7 +323,8 @@ class FileProcessor:
                     "filename": filename,
                     "content_type": content_type,
                     "file_size": len(content),
-                    "word_count": len(cleaned_text.split()),
+                    # cleaned_text is stripped with single-space separators
+                    "word_count": cleaned_text.count(' ') + 1,
                     "character_count": len(cleaned_text),
                     "processing_timestamp": datetime.utcnow().isoformat()
                 }
@@ -66,24 +334,39 @@ class FileProcessor:
             logger.error(f"Error extracting text from file: {e}")
             raise ValueError(f"Failed to process file: {str(e)}")
     
+    def _sniff_content_type(self, content: bytes) -> Optional[str]:
+        """Content type implied by the file's magic bytes, if recognised"""
+        for magic, content_type in FILE_SIGNATURES:
+            if content.startswith(magic):
+                return content_type
+        return None
+    
     def _extract_from_pdf(self, content: bytes) -> str:
         """Extract text from PDF using PyMuPDF with OCR fallback"""
         try:
-            doc = fitz.open(stream=content, filetype="pdf")
-            text = ""
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                page_text = page.get_text()
-                
-                # If no text found, try OCR
-                if not page_text.strip():
-                    page_text = self._ocr_page(page)
+            # Pages are extracted serially and documents one at a time, under
+            # _FITZ_LOCK: PyMuPDF does not support multithreading
+            parts = []
+            ocr_pages = {}
+            with _FITZ_LOCK, fitz.open(stream=content, filetype="pdf") as doc:
+                for page in doc:
+                    page_text = page.get_text("text", flags=PDF_TEXT_FLAGS)
+                    
+                    # If no text found, queue the page for OCR; a page without
+                    # images is genuinely blank and OCR can't find anything on it
+                    if not page_text.strip() and page.get_images(full=False):
+                        ocr_pages[len(parts)] = page
+                    
+                    parts.append(page_text)
                 
-                text += page_text + "\n"
+                if len(ocr_pages) == 1:
+                    index, page = next(iter(ocr_pages.items()))
+                    parts[index] = self._ocr_page(page)
+                elif ocr_pages:
+                    for index, page_text in zip(ocr_pages, self._ocr_pages_batch(list(ocr_pages.values()))):
+                        parts[index] = page_text
             
-            doc.close()
-            return text
+            return "\n".join(parts)
             
         except Exception as e:
             raise ValueError(f"Error processing PDF: {str(e)}")
@@ -92,11 +375,9 @@ class FileProcessor:
         """Extract text from DOCX with enhanced table handling"""
         try:
             doc = Document(io.BytesIO(content))
-            text = ""
             
             # Extract paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            lines = [paragraph.text for paragraph in doc.paragraphs]
             
             # Extract tables with better formatting
             for table in doc.tables:
@@ -107,10 +388,10 @@ class FileProcessor:
                         if cell_text:
                             row_text.append(cell_text)
                     if row_text:
-                        text += " | ".join(row_text) + "\n"
-                text += "\n"  # Add spacing between tables
+                        lines.append(" | ".join(row_text))
+                lines.append("")  # Add spacing between tables
             
-            return text
+            return "\n".join(lines) + "\n" if lines else ""
             
         except Exception as e:
             raise ValueError(f"Error processing DOCX: {str(e)}")
@@ -118,9 +399,15 @@ class FileProcessor:
     def _extract_from_txt(self, content: bytes) -> str:
         """Extract text from plain text file with encoding detection"""
         try:
-            encodings = ['utf-8', 'utf-16', 'cp1252', 'iso-8859-1', 'latin-1']
+            # A byte order mark names the encoding outright
+            for bom, encoding in TEXT_BOMS:
+                if content.startswith(bom):
+                    try:
+                        return content.decode(encoding)
+                    except UnicodeDecodeError:
+                        break
             
-            for encoding in encodings:
+            for encoding in TEXT_ENCODINGS:
                 try:
                     return content.decode(encoding)
                 except UnicodeDecodeError:
@@ -137,11 +424,11 @@ class FileProcessor:
             # Convert bytes to PIL Image
             image = Image.open(io.BytesIO(content))
             
-            # Convert to OpenCV format
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            # Single grayscale uint8 buffer straight from PIL
+            gray = np.asarray(image.convert('L'), dtype=np.uint8)
             
             # Preprocess image for better OCR
-            processed_image = self._preprocess_image_for_ocr(cv_image)
+            processed_image = self._preprocess_image_for_ocr(gray)
             
             # Perform OCR
             text = pytesseract.image_to_string(processed_image)
@@ -151,26 +438,38 @@ class FileProcessor:
         except Exception as e:
             raise ValueError(f"Error processing image: {str(e)}")
     
-    def _preprocess_image_for_ocr(self, image):
-        """Preprocess image for better OCR results"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _preprocess_image_for_ocr(self, gray):
+        """Preprocess a grayscale image for better OCR results"""
+        # Upscale small images so glyphs are large enough for tesseract
+        if max(gray.shape) < OCR_UPSCALE_BELOW:
+            gray = cv2.resize(gray, None, fx=OCR_UPSCALE_FACTOR, fy=OCR_UPSCALE_FACTOR, interpolation=cv2.INTER_CUBIC)
+        
+        # Light blur to suppress noise before binarization
+        gray = cv2.GaussianBlur(gray, (3, 3), 0)
+        
+        # A single global threshold wipes out text in shadowed regions, so
+        # unevenly lit images get per-pixel Sauvola thresholds instead
+        if NUMBA_AVAILABLE and self._has_uneven_illumination(gray):
+            integral, integral_sq = cv2.integral2(gray, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+            return _sauvola_threshold(gray, integral, integral_sq, SAUVOLA_WINDOW, SAUVOLA_K)
         
         # Apply thresholding
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
-        # Remove noise
-        kernel = np.ones((1, 1), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-        
-        return opening
+        return thresh
+    
+    def _has_uneven_illumination(self, gray) -> bool:
+        """Whether brightness varies across the image, judged on a 32x32 thumbnail"""
+        thumbnail = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+        return float(thumbnail.std()) > UNEVEN_ILLUMINATION_STD
     
     def _ocr_page(self, page) -> str:
         """Perform OCR on a PDF page"""
         try:
-            # Convert page to image
-            pix = page.get_pixmap()
-            img_data = pix.tobytes("png")
+            # Convert page to image; PPM is raw pixels, so no PNG deflate/inflate
+            # round trip, and pytesseract hands it to tesseract still as PPM
+            pix = page.get_pixmap(dpi=OCR_DPI)
+            img_data = pix.tobytes("ppm")
             
             # Convert to PIL Image
             image = Image.open(io.BytesIO(img_data))
@@ -184,41 +483,94 @@ class FileProcessor:
             logger.warning(f"OCR failed for page: {e}")
             return ""
     
+    def _ocr_pages_batch(self, pages: List[Any]) -> List[str]:
+        """OCR several PDF pages with one tesseract process, falling back to per-page OCR"""
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                image_paths = []
+                for i, page in enumerate(pages):
+                    path = os.path.join(tmp_dir, f"page-{i}.ppm")
+                    page.get_pixmap(dpi=OCR_DPI).save(path)
+                    image_paths.append(path)
+                
+                list_path = os.path.join(tmp_dir, "images.txt")
+                with open(list_path, "w") as f:
+                    f.write("\n".join(image_paths) + "\n")
+                
+                result = subprocess.run(
+                    [pytesseract.pytesseract.tesseract_cmd, list_path, "stdout"],
+                    capture_output=True, check=True
+                )
+            
+            # tesseract ends every page with a form feed
+            texts = result.stdout.decode("utf-8", errors="replace").split("\f")
+            if len(texts) < len(pages):
+                raise ValueError(f"expected {len(pages)} pages of OCR output, got {len(texts)}")
+            return texts[:len(pages)]
+            
+        except Exception as e:
+            logger.warning(f"Batch OCR failed, falling back to per-page OCR: {e}")
+            return [self._ocr_page(page) for page in pages]
+    
     def _clean_text(self, text: str) -> str:
         """Enhanced text cleaning and normalization"""
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep necessary punctuation
-        text = re.sub(r'[^\w\s\.,;:()\-@/]', '', text)
+        # Replace bullets and remove special characters in one pass,
+        # keeping necessary punctuation
+        text = text.translate(CLEAN_TEXT_TABLE)
         
-        # Fix common OCR/extraction errors
-        text = text.replace('•', '-')  # Replace bullets
-        text = text.replace('  ', ' ')  # Double spaces
-        text = text.replace('\n\n\n', '\n\n')  # Multiple newlines
-        
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        # Collapse all whitespace (including line breaks) to single spaces
+        text = WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
     
     def _extract_structured_info(self, text: str) -> Dict[str, Any]:
         """Extract structured information from resume text"""
+        # Lowercase and split once; every helper reads these shared copies
+        text_lower = text.lower()
+        lines_lower = text_lower.split('\n')
+        keyword_hits = _scan_keywords(text_lower)
+        section_lines = self._scan_section_lines(text, lines_lower)
+        
         info = {
-            "contact_info": self._extract_contact_info(text),
-            "skills": self._extract_skills_section(text),
-            "experience": self._extract_experience_section(text),
-            "education": self._extract_education_section(text),
-            "sections": self._identify_sections(text),
+            "contact_info": self._extract_contact_info(text, text_lower),
+            "skills": self._extract_skills_section(section_lines["skills"], keyword_hits),
+            "experience": self._extract_experience_section(text_lower, section_lines["experience"], keyword_hits),
+            "education": self._extract_education_section(text, section_lines["universities"], keyword_hits),
+            "sections": self._identify_sections(keyword_hits),
             "achievements": self._extract_achievements(text)
         }
         
         return info
     
-    def _extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
+    def _scan_section_lines(self, text: str, lines_lower: List[str]) -> Dict[str, List[str]]:
+        """Walk the lines once, collecting the skills and experience sections and university lines"""
+        section_lines = {name: [] for name in SECTION_BOUNDARIES}
+        section_lines["universities"] = []
+        # None: header not seen yet, True: inside the section, False: section ended
+        state = dict.fromkeys(SECTION_BOUNDARIES)
+        
+        # lower() never adds or removes newlines, so the two line lists align
+        for line, line_lower in zip(text.split('\n'), lines_lower):
+            for name, (headers, terminators) in SECTION_BOUNDARIES.items():
+                if state[name] is False:
+                    continue
+                if any(keyword in line_lower for keyword in headers):
+                    state[name] = True
+                elif state[name]:
+                    if line_lower.strip() == '' or any(keyword in line_lower for keyword in terminators):
+                        state[name] = False
+                    else:
+                        section_lines[name].append(line_lower)
+            
+            if any(keyword in line_lower for keyword in UNIVERSITY_KEYWORDS):
+                section_lines["universities"].append(line.strip())
+        
+        return section_lines
+    
+    def _extract_contact_info(self, text: str, text_lower: str) -> Dict[str, Optional[str]]:
         """Extract contact information with enhanced patterns"""
         contact_info = {
             "email": None,
@@ -229,84 +581,44 @@ class FileProcessor:
         }
         
         # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = EMAIL_RE.search(text)
         if email_match:
             contact_info["email"] = email_match.group()
         
         # Phone patterns (multiple formats)
-        phone_patterns = [
-            r'(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-            r'\+?[\d\s\-\(\)]{10,}',  # International format
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'  # Simple format
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
+        for pattern in PHONE_RES:
+            phone_match = pattern.search(text)
             if phone_match:
                 contact_info["phone"] = phone_match.group()
                 break
         
         # LinkedIn profile
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text.lower())
+        linkedin_match = LINKEDIN_RE.search(text_lower)
         if linkedin_match:
             contact_info["linkedin"] = linkedin_match.group()
         
         # GitHub profile
-        github_pattern = r'github\.com/[\w-]+'
-        github_match = re.search(github_pattern, text.lower())
+        github_match = GITHUB_RE.search(text_lower)
         if github_match:
             contact_info["github"] = github_match.group()
         
         # Website
-        website_pattern = r'https?://(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/\S*)?'
-        website_match = re.search(website_pattern, text)
+        website_match = WEBSITE_RE.search(text)
         if website_match:
             contact_info["website"] = website_match.group()
         
         return contact_info
     
-    def _extract_skills_section(self, text: str) -> Dict[str, Any]:
+    def _extract_skills_section(self, skills_lines: List[str], keyword_hits: Dict[str, set]) -> Dict[str, Any]:
         """Extract skills section with enhanced skill detection"""
-        skills_keywords = ['skills', 'technical skills', 'technologies', 'programming languages', 'tools', 'competencies']
-        
-        # Find skills section
-        skills_text = ""
-        lines = text.lower().split('\n')
-        
-        in_skills_section = False
-        for i, line in enumerate(lines):
-            if any(keyword in line for keyword in skills_keywords):
-                in_skills_section = True
-                continue
-            elif in_skills_section and (line.strip() == '' or any(keyword in line for keyword in ['experience', 'education', 'projects', 'work history'])):
-                break
-            elif in_skills_section:
-                skills_text += line + " "
-        
-        # Enhanced skill detection
-        common_skills = [
-            # Programming languages
-            'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin', 'scala',
-            # Web technologies
-            'react', 'angular', 'vue', 'node.js', 'express', 'fastapi', 'django', 'flask', 'spring', 'html', 'css', 'sass', 'less',
-            # Databases
-            'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server',
-            # Cloud/DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab', 'ci/cd',
-            # AI/ML
-            'machine learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn',
-            # Other
-            'linux', 'api', 'microservices', 'agile', 'scrum', 'jira', 'confluence', 'slack', 'figma', 'adobe'
-        ]
-        
-        found_skills = []
-        text_lower = (skills_text + " " + text).lower()
-        
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
+        skills_text = " ".join(skills_lines)
+        
+        # Enhanced skill detection: the skills text is scanned on its own since
+        # joining its lines can form keywords that span a line break
+        found = keyword_hits["skills"]
+        if skills_text:
+            found = found | _scan_keywords(skills_text)["skills"]
+        found_skills = [skill for skill in COMMON_SKILLS if skill in found]
         
         return {
             "raw_skills_text": skills_text.strip(),
@@ -326,119 +638,53 @@ class FileProcessor:
             "methodologies": []
         }
         
-        skill_categories = {
-            "programming_languages": ['python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'typescript', 'php', 'ruby', 'swift', 'kotlin', 'scala'],
-            "frameworks": ['react', 'angular', 'vue', 'express', 'fastapi', 'django', 'flask', 'spring'],
-            "databases": ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server'],
-            "cloud_platforms": ['aws', 'azure', 'gcp'],
-            "tools": ['docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab', 'jira', 'figma'],
-            "methodologies": ['agile', 'scrum', 'microservices', 'ci/cd']
-        }
-        
         for skill in skills:
-            for category, category_skills in skill_categories.items():
-                if skill in category_skills:
-                    categories[category].append(skill)
-                    break
+            category = SKILL_TO_CATEGORY.get(skill)
+            if category:
+                categories[category].append(skill)
         
         return categories
     
-    def _extract_experience_section(self, text: str) -> Dict[str, Any]:
+    def _extract_experience_section(self, text_lower: str, experience_lines: List[str], keyword_hits: Dict[str, set]) -> Dict[str, Any]:
         """Extract work experience information"""
-        experience_keywords = ['experience', 'work history', 'employment', 'professional experience', 'work experience']
-        
-        # Enhanced experience detection
-        experience_text = ""
-        lines = text.lower().split('\n')
-        
-        in_experience_section = False
-        for i, line in enumerate(lines):
-            if any(keyword in line for keyword in experience_keywords):
-                in_experience_section = True
-                continue
-            elif in_experience_section and (line.strip() == '' or any(keyword in line for keyword in ['education', 'projects', 'skills'])):
-                break
-            elif in_experience_section:
-                experience_text += line + " "
+        experience_text = " ".join(experience_lines)
         
         return {
-            "has_experience_section": any(keyword in text.lower() for keyword in experience_keywords),
-            "years_pattern_found": bool(re.search(r'\d+\+?\s*years?', text.lower())),
-            "company_patterns": len(re.findall(r'\b(?:inc|llc|corp|company|ltd|tech|solutions|systems)\b', text.lower())),
+            "has_experience_section": bool(keyword_hits["experience"]),
+            "years_pattern_found": bool(YEARS_RE.search(text_lower)),
+            "company_patterns": len(COMPANY_RE.findall(text_lower)),
             "experience_text": experience_text.strip(),
-            "job_titles": self._extract_job_titles(text)
+            "job_titles": self._extract_job_titles(text_lower)
         }
     
-    def _extract_job_titles(self, text: str) -> List[str]:
-        """Extract job titles from text"""
-        job_title_patterns = [
-            r'(?:senior|junior|lead|principal|staff)?\s*(?:software engineer|developer|programmer|architect|manager|director|consultant)',
-            r'(?:full stack|front end|back end|devops|data|machine learning|ai|ml)\s*(?:engineer|developer)',
-            r'(?:product|project|program|engineering)\s*(?:manager|director|lead)'
-        ]
-        
-        job_titles = []
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, text.lower())
-            job_titles.extend(matches)
-        
-        return list(set(job_titles))
+    def _extract_job_titles(self, text_lower: str) -> List[str]:
+        """Extract job titles from lowercased text, deduplicated in order of appearance"""
+        return list(dict.fromkeys(JOB_TITLE_RE.findall(text_lower)))
     
-    def _extract_education_section(self, text: str) -> Dict[str, Any]:
+    def _extract_education_section(self, text: str, universities: List[str], keyword_hits: Dict[str, set]) -> Dict[str, Any]:
         """Extract education information"""
-        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
-        degrees = ['bachelor', 'master', 'phd', 'doctorate', 'associates', 'b.s.', 'm.s.', 'b.a.', 'm.a.', 'b.tech', 'm.tech']
+        degrees_found = keyword_hits["degrees"]
         
         return {
-            "has_education_section": any(keyword in text.lower() for keyword in education_keywords),
-            "degrees_mentioned": [degree for degree in degrees if degree in text.lower()],
-            "graduation_years": re.findall(r'\b(19|20)\d{2}\b', text),
-            "universities": self._extract_universities(text)
+            "has_education_section": bool(keyword_hits["education"]),
+            "degrees_mentioned": [degree for degree in DEGREES if degree in degrees_found],
+            "graduation_years": GRADUATION_YEAR_RE.findall(text),
+            "universities": universities
         }
     
-    def _extract_universities(self, text: str) -> List[str]:
-        """Extract university names from text"""
-        university_keywords = ['university', 'college', 'institute', 'school']
-        universities = []
-        
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in university_keywords):
-                universities.append(line.strip())
-        
-        return universities
-    
     def _extract_achievements(self, text: str) -> List[str]:
         """Extract achievements and accomplishments"""
-        achievement_patterns = [
-            r'(?:increased|improved|reduced|achieved|delivered|led|managed|developed|created|implemented).*?(?:by \d+%|\d+%|\d+x|\d+ times)',
-            r'(?:awarded|recognized|honored|received).*?(?:award|recognition|honor)',
-            r'(?:successfully|effectively|efficiently).*?(?:completed|delivered|implemented)'
-        ]
-        
         achievements = []
-        for pattern in achievement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in ACHIEVEMENT_RES:
+            matches = pattern.findall(text)
             achievements.extend(matches)
         
         return achievements
     
-    def _identify_sections(self, text: str) -> List[str]:
+    def _identify_sections(self, keyword_hits: Dict[str, set]) -> List[str]:
         """Identify main resume sections"""
-        common_sections = [
-            'summary', 'objective', 'skills', 'experience', 'education', 'projects', 
-            'certifications', 'awards', 'publications', 'languages', 'volunteer',
-            'interests', 'references'
-        ]
-        
-        found_sections = []
-        text_lower = text.lower()
-        
-        for section in common_sections:
-            if section in text_lower:
-                found_sections.append(section)
-        
-        return found_sections
+        sections_found = keyword_hits["sections"]
+        return [section for section in COMMON_SECTIONS if section in sections_found]
     
     def _assess_quality(self, text: str, structured_info: Dict[str, Any]) -> Dict[str, Any]:
         """Assess resume quality and completeness"""
@@ -1,18 +1,117 @@
 # resume-service/app/services/storage_service.py
-import boto3
 import aioboto3
+from aiobotocore.config import AioConfig
 import asyncio
 import os
+import shutil
+import time
 import uuid
-from typing import Optional, Dict, Any, List, BinaryIO
-from datetime import datetime, timedelta
+from urllib.parse import quote
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, BinaryIO, AsyncIterator, AsyncIterable
+from datetime import datetime, timedelta, date
 import logging
-from botocore.exceptions import ClientError, NoCredentialsError
-import aiofiles
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from cachetools import LRUCache, TTLCache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streamed downloads (64 KiB)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Concurrent connections kept open to S3/Railway per client
+MAX_POOL_CONNECTIONS = 64
+
+# Idle connections stay pooled for 15s (under S3's 20s idle cutoff), and
+# adaptive retries back off client-side when S3 starts throttling
+CLIENT_CONFIG = AioConfig(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connector_args={'keepalive_timeout': 15}
+)
+
+# Presigned URLs are reused while at least half of their lifetime remains
+PRESIGNED_URL_CACHE_SIZE = 10_000
+
+# Cloud metadata and small bodies are cached in-process for a few minutes;
+# keys are never reused by uploads, so only deletes and copies invalidate
+FILE_INFO_CACHE_SIZE = 512
+BODY_CACHE_BYTES = 64 * 1024 * 1024
+BODY_CACHE_MAX_OBJECT = 1024 * 1024
+OBJECT_CACHE_TTL = 300
+
+# A healthy cloud probe is reused for this many seconds
+HEALTH_CACHE_TTL = 5.0
+
+# Keys per ListObjectsV2 page (the S3 maximum)
+LIST_PAGE_SIZE = 1000
+
+# Concurrent HEAD requests issued by get_many_info
+HEAD_CONCURRENCY = 32
+
+# S3 accepts at most 1000 keys per DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# Objects above the threshold move as parallel 8 MiB parts / ranged GETs
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MAX_TRANSFER_CONCURRENCY = 10
+
+# Content types served for local files, by lowercase extension
+CONTENT_TYPES = MappingProxyType({
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.txt': 'text/plain',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif'
+})
+
+# Async S3 clients shared by every StorageService with the same settings,
+# keyed by (event loop, provider, endpoint, region, access key)
+_CLIENT_CACHE: Dict[tuple, tuple] = {}
+_CLIENT_LOCKS: Dict[tuple, asyncio.Lock] = {}
+
+# Last healthy probe per (provider, endpoint, bucket): (result, monotonic time)
+_HEALTH_CACHE: Dict[tuple, tuple] = {}
+
+async def close_clients():
+    """Close the shared S3 clients opened on the running event loop"""
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _CLIENT_CACHE if key[0] is loop]:
+        client_cm, _ = _CLIENT_CACHE.pop(key)
+        _CLIENT_LOCKS.pop(key, None)
+        await client_cm.__aexit__(None, None, None)
+
+# "YYYY/MM/DD" for the current UTC day, recomputed when the day rolls over
+_day_prefix = ("", -1)
+
+def _utc_day_prefix() -> str:
+    """Return today's UTC date as a storage key prefix"""
+    global _day_prefix
+    now = time.time()
+    day = int(now // 86400)
+    if _day_prefix[1] != day:
+        _day_prefix = (datetime.utcfromtimestamp(now).strftime("%Y/%m/%d"), day)
+    return _day_prefix[0]
+
+# utc_now_iso() of the last call, reused within a millisecond
+_iso_now = ("", 0.0)
+
+def utc_now_iso() -> str:
+    """Return the current UTC time in ISO 8601; also used for API response timestamps"""
+    global _iso_now
+    now = time.time()
+    if now - _iso_now[1] >= 0.001:
+        _iso_now = (datetime.utcfromtimestamp(now).isoformat(), now)
+    return _iso_now[0]
+
 class StorageService:
     """Cloud storage service for S3 and Railway integration"""
     
@@ -20,6 +119,14 @@ class StorageService:
         self.provider = provider
         self.session = None
         self.client = None
+        self._client_kwargs: Dict[str, Any] = {}
+        # Static credentials let presigned URLs be signed without the client
+        self._credentials: Optional[Credentials] = None
+        self._signers: Dict[int, S3SigV4QueryAuth] = {}
+        # (storage_key, expiration) -> (url, monotonic time it was signed)
+        self._presigned_urls = LRUCache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+        self._file_info = TTLCache(maxsize=FILE_INFO_CACHE_SIZE, ttl=OBJECT_CACHE_TTL)
+        self._bodies = TTLCache(maxsize=BODY_CACHE_BYTES, ttl=OBJECT_CACHE_TTL, getsizeof=len)
         self.bucket_name = os.getenv("STORAGE_BUCKET_NAME", "resume-service-bucket")
         self.region = os.getenv("AWS_REGION", "us-east-1")
         self.endpoint_url = os.getenv("STORAGE_ENDPOINT_URL")
@@ -31,6 +138,7 @@ class StorageService:
         
         # Initialize storage client
         self._initialize_client()
+        self._bind_operations()
     
     def _initialize_client(self):
         """Initialize the storage client based on provider"""
@@ -48,6 +156,35 @@ class StorageService:
             logger.error(f"Failed to initialize storage client: {e}")
             raise
     
+    def _bind_operations(self):
+        """Resolve the provider-specific implementations once, instead of per call"""
+        if self.provider in ["s3", "railway"]:
+            self._upload = self._upload_to_cloud
+            self._upload_stream = self._upload_stream_to_cloud
+            self._download = self._download_from_cloud
+            self._stream = self._stream_from_cloud
+            self._delete = self._delete_from_cloud
+            self._delete_many = self._delete_many_from_cloud
+            self._presigned_url = self._generate_presigned_cloud_url
+            self._list = self._list_cloud_files
+            self._iter_files = self._iter_cloud_files
+            self._get_info = self._get_cloud_file_info
+            self._copy = self._copy_cloud_file
+            self._health_check = self._cloud_health_check
+        else:
+            self._upload = self._upload_to_local
+            self._upload_stream = self._upload_stream_to_local
+            self._download = self._download_from_local
+            self._stream = self._stream_from_local
+            self._delete = self._delete_from_local
+            self._delete_many = self._delete_many_from_local
+            self._presigned_url = self._generate_presigned_local_url
+            self._list = self._list_local_files
+            self._iter_files = self._iter_local_files
+            self._get_info = self._get_local_file_info
+            self._copy = self._copy_local_file
+            self._health_check = self._local_health_check
+    
     def _init_s3_client(self):
         """Initialize AWS S3 client"""
         session_kwargs = {
@@ -59,16 +196,11 @@ class StorageService:
         if self.session_token:
             session_kwargs['aws_session_token'] = self.session_token
         
-        self.session = boto3.Session(**session_kwargs)
-        self.client = self.session.client('s3')
-        
-        # Test connection
-        try:
-            self.client.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"Successfully connected to S3 bucket: {self.bucket_name}")
-        except ClientError as e:
-            logger.error(f"Failed to connect to S3 bucket: {e}")
-            raise
+        self.session = aioboto3.Session(**session_kwargs)
+        self._client_kwargs = {
+            'config': CLIENT_CONFIG
+        }
+        self._init_signing(f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com")
     
     def _init_railway_client(self):
         """Initialize Railway storage client (S3-compatible)"""
@@ -81,20 +213,19 @@ class StorageService:
             'region_name': self.region
         }
         
-        self.session = boto3.Session(**session_kwargs)
-        self.client = self.session.client(
-            's3',
-            endpoint_url=self.endpoint_url,
-            region_name=self.region
-        )
-        
-        # Test connection
-        try:
-            self.client.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"Successfully connected to Railway storage: {self.bucket_name}")
-        except ClientError as e:
-            logger.error(f"Failed to connect to Railway storage: {e}")
-            raise
+        self.session = aioboto3.Session(**session_kwargs)
+        self._client_kwargs = {
+            'endpoint_url': self.endpoint_url,
+            'region_name': self.region,
+            'config': CLIENT_CONFIG
+        }
+        self._init_signing(f"{self.endpoint_url.rstrip('/')}/{self.bucket_name}")
+    
+    def _init_signing(self, url_base: str):
+        """Enable local URL signing when credentials come from the environment"""
+        self._url_base = url_base
+        if self.access_key_id and self.secret_access_key:
+            self._credentials = Credentials(self.access_key_id, self.secret_access_key, self.session_token)
     
     def _init_local_client(self):
         """Initialize local file storage"""
@@ -102,20 +233,72 @@ class StorageService:
         self.local_storage_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Initialized local storage at: {self.local_storage_path}")
     
+    async def startup(self):
+        """Attach the shared async S3 client for this configuration"""
+        if self.provider not in ["s3", "railway"] or self.client is not None:
+            return
+        
+        key = (asyncio.get_running_loop(), self.provider, self.endpoint_url,
+               self.region, self.access_key_id)
+        async with _CLIENT_LOCKS.setdefault(key, asyncio.Lock()):
+            if key not in _CLIENT_CACHE:
+                client_cm = self.session.client('s3', **self._client_kwargs)
+                _CLIENT_CACHE[key] = (client_cm, await client_cm.__aenter__())
+        
+        self.client = _CLIENT_CACHE[key][1]
+    
+    async def verify(self):
+        """Check the bucket is reachable; called once at application startup"""
+        if self.provider not in ["s3", "railway"]:
+            return
+        
+        client = await self._get_client()
+        try:
+            await client.head_bucket(Bucket=self.bucket_name)
+            logger.info(f"Successfully connected to {self.provider} bucket: {self.bucket_name}")
+        except ClientError as e:
+            logger.error(f"Failed to connect to {self.provider} bucket: {e}")
+            raise
+    
+    async def shutdown(self):
+        """Detach from the shared client; close_clients() closes the pool"""
+        self.client = None
+    
+    async def __aenter__(self) -> "StorageService":
+        await self.startup()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.shutdown()
+    
+    async def _get_client(self):
+        """Return the shared async S3 client, opening it on first use"""
+        if self.client is None:
+            await self.startup()
+        return self.client
+    
     async def upload_file(self, file_content: bytes, filename: str, content_type: str = None) -> Dict[str, Any]:
         """Upload file to cloud storage"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._upload_to_cloud(file_content, filename, content_type)
-            elif self.provider == "local":
-                return await self._upload_to_local(file_content, filename, content_type)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._upload(file_content, filename, content_type)
         except Exception as e:
             logger.error(f"Failed to upload file {filename}: {e}")
+            self._expire_health_on_error(e)
             raise
     
+    async def bulk_upload(self, files: List[Tuple[bytes, str, Optional[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """Upload (content, filename, content_type) tuples concurrently; None marks a failed upload"""
+        semaphore = asyncio.Semaphore(MAX_POOL_CONNECTIONS)
+        
+        async def upload(file_content: bytes, filename: str, content_type: Optional[str]):
+            async with semaphore:
+                try:
+                    return await self.upload_file(file_content, filename, content_type)
+                except Exception:
+                    return None
+        
+        return await asyncio.gather(*(upload(*file) for file in files))
+    
     async def _upload_to_cloud(self, file_content: bytes, filename: str, content_type: str = None) -> Dict[str, Any]:
         """Upload file to S3 or Railway"""
         # Generate unique storage key
@@ -126,12 +309,16 @@ class StorageService:
         if content_type:
             extra_args['ContentType'] = content_type
         
-        self.client.put_object(
-            Bucket=self.bucket_name,
-            Key=storage_key,
-            Body=file_content,
-            **extra_args
-        )
+        client = await self._get_client()
+        if len(file_content) > MULTIPART_THRESHOLD:
+            await self._multipart_upload(client, storage_key, self._iter_parts(file_content), extra_args)
+        else:
+            await client.put_object(
+                Bucket=self.bucket_name,
+                Key=storage_key,
+                Body=file_content,
+                **extra_args
+            )
         
         # Generate URL
         url = self._generate_url(storage_key)
@@ -142,9 +329,147 @@ class StorageService:
             "bucket_name": self.bucket_name,
             "region": self.region,
             "file_size": len(file_content),
-            "uploaded_at": datetime.utcnow().isoformat()
+            "uploaded_at": utc_now_iso()
+        }
+    
+    async def upload_stream(self, reader: AsyncIterable[bytes], filename: str, content_type: str = None) -> Dict[str, Any]:
+        """Upload a file from an async byte stream without holding it all in memory"""
+        try:
+            return await self._upload_stream(reader, filename, content_type)
+        except Exception as e:
+            logger.error(f"Failed to upload stream {filename}: {e}")
+            self._expire_health_on_error(e)
+            raise
+    
+    async def _upload_stream_to_cloud(self, reader: AsyncIterable[bytes], filename: str, content_type: str = None) -> Dict[str, Any]:
+        """Stream an upload to S3 or Railway, switching to multipart once it outgrows one part"""
+        storage_key = self._generate_storage_key(filename)
+        
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        
+        client = await self._get_client()
+        parts = self._rechunk(reader, MULTIPART_CHUNKSIZE)
+        first = await self._next_part(parts)
+        second = await self._next_part(parts)
+        file_size = len(first or b"")
+        
+        if second is None:
+            await client.put_object(Bucket=self.bucket_name, Key=storage_key, Body=first or b"", **extra_args)
+        else:
+            async def all_parts() -> AsyncIterator[bytes]:
+                nonlocal file_size
+                yield first
+                file_size += len(second)
+                yield second
+                async for part in parts:
+                    file_size += len(part)
+                    yield part
+            
+            await self._multipart_upload(client, storage_key, all_parts(), extra_args)
+        
+        return {
+            "storage_key": storage_key,
+            "storage_url": self._generate_url(storage_key),
+            "bucket_name": self.bucket_name,
+            "region": self.region,
+            "file_size": file_size,
+            "uploaded_at": utc_now_iso()
+        }
+    
+    async def _upload_stream_to_local(self, reader: AsyncIterable[bytes], filename: str, content_type: str = None) -> Dict[str, Any]:
+        """Stream an upload to local storage chunk by chunk"""
+        storage_key = self._generate_storage_key(filename)
+        file_path = self.local_storage_path / storage_key
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        file_size = 0
+        f = await asyncio.to_thread(open, file_path, 'wb')
+        try:
+            async for chunk in reader:
+                await asyncio.to_thread(f.write, chunk)
+                file_size += len(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+        
+        return {
+            "storage_key": storage_key,
+            "storage_url": str(file_path),
+            "bucket_name": "local",
+            "region": "local",
+            "file_size": file_size,
+            "uploaded_at": utc_now_iso()
         }
     
+    async def _rechunk(self, reader: AsyncIterable[bytes], part_size: int) -> AsyncIterator[bytes]:
+        """Regroup an arbitrary byte stream into part_size pieces (the last may be shorter)"""
+        buffer = bytearray()
+        async for chunk in reader:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                yield bytes(buffer[:part_size])
+                del buffer[:part_size]
+        if buffer:
+            yield bytes(buffer)
+    
+    async def _next_part(self, parts: AsyncIterator[bytes]) -> Optional[bytes]:
+        """Next item of an async iterator, or None once it is exhausted"""
+        try:
+            return await parts.__anext__()
+        except StopAsyncIteration:
+            return None
+    
+    async def _iter_parts(self, file_content: bytes) -> AsyncIterator[bytes]:
+        """Split an in-memory upload into multipart-sized parts"""
+        for start in range(0, len(file_content), MULTIPART_CHUNKSIZE):
+            yield file_content[start:start + MULTIPART_CHUNKSIZE]
+    
+    async def _multipart_upload(self, client, storage_key: str, parts: AsyncIterator[bytes], extra_args: Dict[str, Any]):
+        """Upload parts concurrently as one multipart upload, aborting it on failure"""
+        upload = await client.create_multipart_upload(Bucket=self.bucket_name, Key=storage_key, **extra_args)
+        upload_id = upload['UploadId']
+        # Taken before each part is read, so at most MAX_TRANSFER_CONCURRENCY parts sit in memory
+        semaphore = asyncio.Semaphore(MAX_TRANSFER_CONCURRENCY)
+        
+        async def send_part(part_number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                response = await client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=storage_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body
+                )
+                return {'PartNumber': part_number, 'ETag': response['ETag']}
+            finally:
+                semaphore.release()
+        
+        tasks = []
+        try:
+            await semaphore.acquire()
+            async for body in parts:
+                tasks.append(asyncio.create_task(send_part(len(tasks) + 1, body)))
+                await semaphore.acquire()
+            semaphore.release()
+            
+            completed = await asyncio.gather(*tasks)
+            await client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=storage_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': completed}
+            )
+        except BaseException:
+            # Cancellation (e.g. a client disconnect) must abort too, or the
+            # uploaded parts stay billed in the bucket. Wait for in-flight parts
+            # to settle first so none lands after the abort.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await client.abort_multipart_upload(Bucket=self.bucket_name, Key=storage_key, UploadId=upload_id)
+            raise
+    
     async def _upload_to_local(self, file_content: bytes, filename: str, content_type: str = None) -> Dict[str, Any]:
         """Upload file to local storage"""
         storage_key = self._generate_storage_key(filename)
@@ -154,8 +479,7 @@ class StorageService:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(file_content)
+        await asyncio.to_thread(file_path.write_bytes, file_content)
         
         return {
             "storage_key": storage_key,
@@ -163,27 +487,65 @@ class StorageService:
             "bucket_name": "local",
             "region": "local",
             "file_size": len(file_content),
-            "uploaded_at": datetime.utcnow().isoformat()
+            "uploaded_at": utc_now_iso()
         }
     
     async def download_file(self, storage_key: str) -> bytes:
         """Download file from cloud storage"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._download_from_cloud(storage_key)
-            elif self.provider == "local":
-                return await self._download_from_local(storage_key)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._download(storage_key)
         except Exception as e:
             logger.error(f"Failed to download file {storage_key}: {e}")
+            self._expire_health_on_error(e)
             raise
     
     async def _download_from_cloud(self, storage_key: str) -> bytes:
-        """Download file from S3 or Railway"""
-        response = self.client.get_object(Bucket=self.bucket_name, Key=storage_key)
-        return response['Body'].read()
+        """Download file from S3 or Railway, fetching large objects as parallel ranges"""
+        cached = self._bodies.get(storage_key)
+        if cached is not None:
+            return cached
+        
+        client = await self._get_client()
+        
+        # The first range also tells us the object size
+        try:
+            response = await client.get_object(
+                Bucket=self.bucket_name,
+                Key=storage_key,
+                Range=f"bytes=0-{MULTIPART_CHUNKSIZE - 1}"
+            )
+        except ClientError as e:
+            # Empty objects can't satisfy a byte range
+            if e.response.get('Error', {}).get('Code') != 'InvalidRange':
+                raise
+            response = await client.get_object(Bucket=self.bucket_name, Key=storage_key)
+        
+        first = await self._read_body(response)
+        content_range = response.get('ContentRange')
+        total_size = int(content_range.rpartition('/')[2]) if content_range else len(first)
+        if total_size <= len(first):
+            if total_size <= BODY_CACHE_MAX_OBJECT:
+                self._bodies[storage_key] = first
+            return first
+        
+        semaphore = asyncio.Semaphore(MAX_TRANSFER_CONCURRENCY)
+        
+        async def fetch_range(start: int) -> bytes:
+            end = min(start + MULTIPART_CHUNKSIZE, total_size) - 1
+            async with semaphore:
+                part = await client.get_object(Bucket=self.bucket_name, Key=storage_key, Range=f"bytes={start}-{end}")
+                return await self._read_body(part)
+        
+        rest = await asyncio.gather(*(
+            fetch_range(start) for start in range(len(first), total_size, MULTIPART_CHUNKSIZE)
+        ))
+        return b"".join([first, *rest])
+    
+    async def _read_body(self, response: Dict[str, Any]) -> bytes:
+        """Read a get_object body and release its connection"""
+        body = response['Body']
+        async with body:
+            return await body.read()
     
     async def _download_from_local(self, storage_key: str) -> bytes:
         """Download file from local storage"""
@@ -192,19 +554,39 @@ class StorageService:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {storage_key}")
         
-        async with aiofiles.open(file_path, 'rb') as f:
-            return await f.read()
-    
+        return await asyncio.to_thread(file_path.read_bytes)
+
+    def stream_file(self, storage_key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Stream file content from storage in fixed-size chunks"""
+        return self._stream(storage_key, chunk_size)
+
+    async def _stream_from_cloud(self, storage_key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream file from S3 or Railway without buffering the whole object"""
+        client = await self._get_client()
+        response = await client.get_object(Bucket=self.bucket_name, Key=storage_key)
+        body = response['Body']
+        async with body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    async def _stream_from_local(self, storage_key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream file from local storage"""
+        file_path = self.local_storage_path / storage_key
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {storage_key}")
+
+        f = await asyncio.to_thread(open, file_path, 'rb')
+        try:
+            while chunk := await asyncio.to_thread(f.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+
     async def delete_file(self, storage_key: str) -> bool:
         """Delete file from cloud storage"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._delete_from_cloud(storage_key)
-            elif self.provider == "local":
-                return await self._delete_from_local(storage_key)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._delete(storage_key)
         except Exception as e:
             logger.error(f"Failed to delete file {storage_key}: {e}")
             return False
@@ -212,7 +594,9 @@ class StorageService:
     async def _delete_from_cloud(self, storage_key: str) -> bool:
         """Delete file from S3 or Railway"""
         try:
-            self.client.delete_object(Bucket=self.bucket_name, Key=storage_key)
+            client = await self._get_client()
+            await client.delete_object(Bucket=self.bucket_name, Key=storage_key)
+            self._invalidate(storage_key)
             return True
         except ClientError:
             return False
@@ -228,33 +612,102 @@ class StorageService:
         except Exception:
             return False
     
-    def generate_presigned_url(self, storage_key: str, expiration: int = 3600) -> str:
+    async def delete_many(self, storage_keys: List[str]) -> Dict[str, bool]:
+        """Delete many files at once; returns whether each key was deleted"""
+        try:
+            return await self._delete_many(storage_keys)
+        except Exception as e:
+            logger.error(f"Failed to delete {len(storage_keys)} files: {e}")
+            return {key: False for key in storage_keys}
+    
+    async def _delete_many_from_cloud(self, storage_keys: List[str]) -> Dict[str, bool]:
+        """Delete keys from S3 or Railway in DeleteObjects batches sent concurrently"""
+        client = await self._get_client()
+        semaphore = asyncio.Semaphore(MAX_TRANSFER_CONCURRENCY)
+        
+        async def delete_batch(batch: List[str]) -> List[str]:
+            async with semaphore:
+                try:
+                    response = await client.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                    )
+                except ClientError as e:
+                    logger.error(f"Failed to delete batch of {len(batch)} files: {e}")
+                    return batch
+                # Quiet mode only reports the keys that failed
+                return [error['Key'] for error in response.get('Errors', [])]
+        
+        failed_batches = await asyncio.gather(*(
+            delete_batch(storage_keys[start:start + DELETE_BATCH_SIZE])
+            for start in range(0, len(storage_keys), DELETE_BATCH_SIZE)
+        ))
+        failed = {key for batch in failed_batches for key in batch}
+        self._invalidate(*storage_keys)
+        return {key: key not in failed for key in storage_keys}
+    
+    async def _delete_many_from_local(self, storage_keys: List[str]) -> Dict[str, bool]:
+        """Delete keys from local storage in a worker thread"""
+        return await asyncio.to_thread(self._unlink_local_files, storage_keys)
+    
+    def _unlink_local_files(self, storage_keys: List[str]) -> Dict[str, bool]:
+        """Unlink local files, recording which ones existed"""
+        results = {}
+        for key in storage_keys:
+            try:
+                (self.local_storage_path / key).unlink()
+                results[key] = True
+            except OSError:
+                results[key] = False
+        return results
+    
+    async def generate_presigned_url(self, storage_key: str, expiration: int = 3600) -> str:
         """Generate presigned URL for file access"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return self._generate_presigned_cloud_url(storage_key, expiration)
-            elif self.provider == "local":
-                return self._generate_local_url(storage_key)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._presigned_url(storage_key, expiration)
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {storage_key}: {e}")
             raise
     
-    def _generate_presigned_cloud_url(self, storage_key: str, expiration: int) -> str:
-        """Generate presigned URL for S3 or Railway"""
+    async def _generate_presigned_cloud_url(self, storage_key: str, expiration: int) -> str:
+        """Generate presigned URL for S3 or Railway, reusing recent signatures"""
+        cache_key = (storage_key, expiration)
+        cached = self._presigned_urls.get(cache_key)
+        if cached and time.monotonic() - cached[1] < expiration / 2:
+            return cached[0]
+        
         try:
-            url = self.client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': storage_key},
-                ExpiresIn=expiration
-            )
+            signed_at = time.monotonic()
+            if self._credentials is not None:
+                url = self._sign_url(storage_key, expiration)
+            else:
+                client = await self._get_client()
+                url = await client.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': self.bucket_name, 'Key': storage_key},
+                    ExpiresIn=expiration
+                )
+            self._presigned_urls[cache_key] = (url, signed_at)
             return url
         except Exception as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             raise
     
+    def _sign_url(self, storage_key: str, expiration: int) -> str:
+        """Sign a GET URL locally with SigV4, skipping botocore's request pipeline"""
+        signer = self._signers.get(expiration)
+        if signer is None:
+            signer = S3SigV4QueryAuth(self._credentials, 's3', self.region, expires=expiration)
+            self._signers[expiration] = signer
+        
+        request = AWSRequest(method='GET', url=f"{self._url_base}/{quote(storage_key, safe='/~')}")
+        signer.add_auth(request)
+        return request.url
+    
+    async def _generate_presigned_local_url(self, storage_key: str, expiration: int) -> str:
+        """Local files need no signing; return their file URL"""
+        return self._generate_local_url(storage_key)
+    
     def _generate_local_url(self, storage_key: str) -> str:
         """Generate local file URL"""
         file_path = self.local_storage_path / storage_key
@@ -273,104 +726,198 @@ class StorageService:
     
     def _generate_storage_key(self, filename: str) -> str:
         """Generate unique storage key for file"""
-        timestamp = datetime.utcnow().strftime("%Y/%m/%d")
-        unique_id = str(uuid.uuid4())
-        extension = Path(filename).suffix
+        # Same result as Path(filename).suffix without building a Path
+        name = filename.rpartition('/')[2]
+        dot = name.rfind('.')
+        extension = name[dot:] if 0 < dot < len(name) - 1 else ""
         
-        return f"resumes/{timestamp}/{unique_id}{extension}"
+        return f"resumes/{_utc_day_prefix()}/{uuid.uuid4().hex}{extension}"
     
     async def list_files(self, prefix: str = "", max_keys: int = 1000) -> List[Dict[str, Any]]:
         """List files in storage"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._list_cloud_files(prefix, max_keys)
-            elif self.provider == "local":
-                return await self._list_local_files(prefix, max_keys)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._list(prefix, max_keys)
         except Exception as e:
             logger.error(f"Failed to list files: {e}")
+            self._expire_health_on_error(e)
             return []
     
+    def list_files_iter(self, prefix: str = "") -> AsyncIterator[Dict[str, Any]]:
+        """Yield every file under prefix, fetching listing pages lazily"""
+        return self._iter_files(prefix)
+    
+    async def _iter_cloud_files(self, prefix: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield files from S3 or Railway one listing page at a time"""
+        client = await self._get_client()
+        paginator = client.get_paginator('list_objects_v2')
+        async for page in paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': LIST_PAGE_SIZE}
+        ):
+            for obj in page.get('Contents', []):
+                # Carries what head_object would, minus the content type
+                yield {
+                    "key": obj['Key'],
+                    "size": obj['Size'],
+                    "content_type": None,
+                    "last_modified": obj['LastModified'].isoformat(),
+                    "etag": obj['ETag'],
+                    "url": self._generate_url(obj['Key'])
+                }
+    
+    async def _iter_local_files(self, prefix: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield files from local storage"""
+        for file_info in await self._list_local_files(prefix, None):
+            yield file_info
+    
+    async def list_files_by_day(self, start_day: date, end_day: date) -> AsyncIterator[Dict[str, Any]]:
+        """Yield files uploaded between two days (inclusive), in no particular order"""
+        # Keys are sharded as resumes/YYYY/MM/DD/ and S3 rate-limits per prefix,
+        # so one paginator per day runs concurrently instead of walking resumes/
+        prefixes = [
+            f"resumes/{start_day + timedelta(days=offset):%Y/%m/%d}/"
+            for offset in range((end_day - start_day).days + 1)
+        ]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LIST_PAGE_SIZE)
+        finished = object()
+        semaphore = asyncio.Semaphore(MAX_TRANSFER_CONCURRENCY)
+        
+        async def list_prefix(prefix: str):
+            async with semaphore:
+                async for file_info in self.list_files_iter(prefix):
+                    await queue.put(file_info)
+        
+        tasks = [asyncio.create_task(list_prefix(prefix)) for prefix in prefixes]
+        
+        async def list_all():
+            try:
+                if tasks:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                    for task in done:
+                        task.result()
+            except Exception:
+                # Stop the other prefixes so none stays blocked on a full queue
+                for task in tasks:
+                    task.cancel()
+                await queue.put(finished)
+                raise
+            await queue.put(finished)
+        
+        producer = asyncio.create_task(list_all())
+        try:
+            while (file_info := await queue.get()) is not finished:
+                yield file_info
+            # Surface any listing error
+            await producer
+        finally:
+            # Also reached when the consumer stops early; release every paginator
+            for task in (producer, *tasks):
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+    
     async def _list_cloud_files(self, prefix: str, max_keys: int) -> List[Dict[str, Any]]:
-        """List files in S3 or Railway"""
+        """List files in S3 or Railway, following pagination up to max_keys"""
         try:
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
-            
             files = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    files.append({
-                        "key": obj['Key'],
-                        "size": obj['Size'],
-                        "last_modified": obj['LastModified'].isoformat(),
-                        "url": self._generate_url(obj['Key'])
-                    })
+            async for file_info in self.list_files_iter(prefix):
+                files.append(file_info)
+                if len(files) >= max_keys:
+                    break
             
             return files
         except Exception as e:
             logger.error(f"Failed to list cloud files: {e}")
+            # The error stops here, so list_files never sees it to expire the probe
+            self._expire_health_on_error(e)
             return []
     
-    async def _list_local_files(self, prefix: str, max_keys: int) -> List[Dict[str, Any]]:
+    async def _list_local_files(self, prefix: str, max_keys: Optional[int]) -> List[Dict[str, Any]]:
         """List files in local storage"""
         try:
-            files = []
-            prefix_path = self.local_storage_path / prefix
-            
-            if prefix_path.exists():
-                for file_path in prefix_path.rglob("*"):
-                    if file_path.is_file():
-                        stat = file_path.stat()
+            return await asyncio.to_thread(self._scan_local_files, prefix, max_keys)
+        except Exception as e:
+            logger.error(f"Failed to list local files: {e}")
+            return []
+    
+    def _scan_local_files(self, prefix: str, max_keys: Optional[int]) -> List[Dict[str, Any]]:
+        """Walk local storage with os.scandir, stopping as soon as max_keys files are found"""
+        files = []
+        prefix_path = self.local_storage_path / prefix
+        if not prefix_path.is_dir():
+            return files
+        
+        root_url = f"file://{self.local_storage_path.absolute()}/"
+        key_prefix = str(prefix_path.relative_to(self.local_storage_path))
+        stack = [(str(prefix_path), "" if key_prefix == "." else key_prefix + "/")]
+        
+        while stack:
+            dir_path, dir_key = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    key = dir_key + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, key + "/"))
+                    elif entry.is_file():
+                        stat = entry.stat()
                         files.append({
-                            "key": str(file_path.relative_to(self.local_storage_path)),
+                            "key": key,
                             "size": stat.st_size,
                             "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            "url": f"file://{file_path.absolute()}"
+                            "url": root_url + key
                         })
                         
-                        if len(files) >= max_keys:
-                            break
-            
-            return files
-        except Exception as e:
-            logger.error(f"Failed to list local files: {e}")
-            return []
+                        if max_keys is not None and len(files) >= max_keys:
+                            return files
+        
+        return files
     
     async def get_file_info(self, storage_key: str) -> Optional[Dict[str, Any]]:
         """Get file information"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._get_cloud_file_info(storage_key)
-            elif self.provider == "local":
-                return await self._get_local_file_info(storage_key)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._get_info(storage_key)
         except Exception as e:
             logger.error(f"Failed to get file info for {storage_key}: {e}")
             return None
     
+    async def get_many_info(self, storage_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get file information for many keys concurrently, in input order"""
+        semaphore = asyncio.Semaphore(HEAD_CONCURRENCY)
+        
+        async def get_info(storage_key: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_file_info(storage_key)
+        
+        return await asyncio.gather(*(get_info(key) for key in storage_keys))
+    
     async def _get_cloud_file_info(self, storage_key: str) -> Optional[Dict[str, Any]]:
         """Get file information from S3 or Railway"""
+        cached = self._file_info.get(storage_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            response = self.client.head_object(Bucket=self.bucket_name, Key=storage_key)
-            
-            return {
-                "key": storage_key,
-                "size": response['ContentLength'],
-                "content_type": response.get('ContentType'),
-                "last_modified": response['LastModified'].isoformat(),
-                "etag": response['ETag'],
-                "url": self._generate_url(storage_key)
-            }
+            client = await self._get_client()
+            response = await client.head_object(Bucket=self.bucket_name, Key=storage_key)
         except ClientError:
             return None
+        
+        info = {
+            "key": storage_key,
+            "size": response['ContentLength'],
+            "content_type": response.get('ContentType'),
+            "last_modified": response['LastModified'].isoformat(),
+            "etag": response['ETag'],
+            "url": self._generate_url(storage_key)
+        }
+        self._file_info[storage_key] = info
+        return dict(info)
+    
+    def _invalidate(self, *storage_keys: str):
+        """Drop cached metadata and bodies for keys that were deleted or overwritten"""
+        for key in storage_keys:
+            self._file_info.pop(key, None)
+            self._bodies.pop(key, None)
     
     async def _get_local_file_info(self, storage_key: str) -> Optional[Dict[str, Any]]:
         """Get file information from local storage"""
@@ -394,31 +941,12 @@ class StorageService:
     
     def _guess_content_type(self, file_path: Path) -> str:
         """Guess content type based on file extension"""
-        extension = file_path.suffix.lower()
-        
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.txt': 'text/plain',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif'
-        }
-        
-        return content_types.get(extension, 'application/octet-stream')
+        return CONTENT_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
     
     async def copy_file(self, source_key: str, destination_key: str) -> bool:
         """Copy file within storage"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._copy_cloud_file(source_key, destination_key)
-            elif self.provider == "local":
-                return await self._copy_local_file(source_key, destination_key)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
-                
+            return await self._copy(source_key, destination_key)
         except Exception as e:
             logger.error(f"Failed to copy file from {source_key} to {destination_key}: {e}")
             return False
@@ -427,7 +955,9 @@ class StorageService:
         """Copy file in S3 or Railway"""
         try:
             copy_source = {'Bucket': self.bucket_name, 'Key': source_key}
-            self.client.copy(copy_source, self.bucket_name, destination_key)
+            client = await self._get_client()
+            await client.copy(copy_source, self.bucket_name, destination_key)
+            self._invalidate(destination_key)
             return True
         except ClientError:
             return False
@@ -444,12 +974,8 @@ class StorageService:
             # Ensure destination directory exists
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy file
-            async with aiofiles.open(source_path, 'rb') as src:
-                content = await src.read()
-            
-            async with aiofiles.open(dest_path, 'wb') as dst:
-                await dst.write(content)
+            # Copy file in the kernel (sendfile on Linux) without reading it into memory
+            await asyncio.to_thread(shutil.copyfile, source_path, dest_path)
             
             return True
         except Exception:
@@ -458,48 +984,59 @@ class StorageService:
     async def health_check(self) -> Dict[str, Any]:
         """Check storage service health"""
         try:
-            if self.provider in ["s3", "railway"]:
-                return await self._cloud_health_check()
-            elif self.provider == "local":
-                return await self._local_health_check()
-            else:
-                return {"status": "unknown", "provider": self.provider}
-                
+            return await self._health_check()
         except Exception as e:
             logger.error(f"Storage health check failed: {e}")
             return {"status": "error", "error": str(e)}
     
     async def _cloud_health_check(self) -> Dict[str, Any]:
-        """Check cloud storage health"""
+        """Check cloud storage health, reusing a recent healthy probe"""
+        health_key = (self.provider, self.endpoint_url, self.bucket_name)
+        cached = _HEALTH_CACHE.get(health_key)
+        if cached and time.monotonic() - cached[1] < HEALTH_CACHE_TTL:
+            return dict(cached[0])
+        
         try:
-            start_time = datetime.utcnow()
-            self.client.head_bucket(Bucket=self.bucket_name)
-            response_time = (datetime.utcnow() - start_time).total_seconds()
+            start_time = time.perf_counter()
+            client = await self._get_client()
+            # Exercises credentials and bucket access without listing anything real
+            await client.list_objects_v2(Bucket=self.bucket_name, Prefix="__ping__", MaxKeys=1)
+            response_time = time.perf_counter() - start_time
             
-            return {
+            result = {
                 "status": "healthy",
                 "provider": self.provider,
                 "bucket": self.bucket_name,
                 "region": self.region,
                 "response_time": response_time,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
+            _HEALTH_CACHE[health_key] = (result, time.monotonic())
+            return dict(result)
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "provider": self.provider,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
     
+    def _expire_health_on_error(self, error: Exception):
+        """Force a fresh health probe after a server-side or connection failure"""
+        if isinstance(error, ClientError):
+            if error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) < 500:
+                return
+        elif not isinstance(error, (BotoCoreError, OSError)):
+            return
+        _HEALTH_CACHE.pop((self.provider, self.endpoint_url, self.bucket_name), None)
+    
     async def _local_health_check(self) -> Dict[str, Any]:
         """Check local storage health"""
         try:
             # Check if storage directory is writable
             test_file = self.local_storage_path / ".health_check"
             
-            async with aiofiles.open(test_file, 'w') as f:
-                await f.write("health_check")
+            await asyncio.to_thread(test_file.write_text, "health_check")
             
             test_file.unlink()
             
@@ -508,13 +1045,13 @@ class StorageService:
                 "provider": "local",
                 "path": str(self.local_storage_path),
                 "writable": True,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "provider": "local",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
 
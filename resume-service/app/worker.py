@@ -0,0 +1,43 @@
+# resume-service/app/worker.py
+import inspect
+import logging
+
+try:
+    # Installed with uvicorn[standard]; arq builds its loop from the policy
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+from .database import get_db_context
+from .queue_config import REDIS_SETTINGS
+from .services.resume_service import ResumeService
+
+logger = logging.getLogger(__name__)
+
+resume_service = ResumeService()
+
+async def _run_with_session(job, record_id: str):
+    """Run a ResumeService job with a session owned by the worker"""
+    db = get_db_context()
+    try:
+        result = job(db, record_id)
+        if inspect.isawaitable(result):
+            await result
+    finally:
+        db.close()
+
+async def process_resume_optimization(ctx, optimization_id: str):
+    """Process a queued resume optimization"""
+    logger.info("Processing optimization %s", optimization_id)
+    await _run_with_session(resume_service.process_resume_optimization, optimization_id)
+
+async def process_resume_analysis(ctx, analysis_id: str):
+    """Process a queued resume analysis"""
+    logger.info("Processing analysis %s", analysis_id)
+    await _run_with_session(resume_service.process_resume_analysis, analysis_id)
+
+class WorkerSettings:
+    """arq worker configuration: `arq app.worker.WorkerSettings`"""
+    functions = [process_resume_optimization, process_resume_analysis]
+    redis_settings = REDIS_SETTINGS
@@ -1,18 +1,25 @@
 # resume-service/main.py
 import os
+import asyncio
+import time
 import logging
+import orjson
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Dict, Any
+from dataclasses import replace
+from typing import Dict, Any, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+from arq import create_pool
 
-from app.database import init_db, health_check as db_health_check
-from app.services.storage_service import StorageService
+from app.database import init_db, health_check as db_health_check, get_db_stats, get_storage_stats
+from app.services.storage_service import StorageService, close_clients, utc_now_iso
+from app.queue_config import REDIS_SETTINGS
+from app.health_interceptor import HealthCheckInterceptor
+from app.dependencies import get_storage
 from app.routers import resume_routes
 
 # Configure logging
@@ -22,6 +29,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The API falls back to in-process processing, so startup shouldn't spend
+# seconds retrying an unreachable Redis the way the worker does
+API_REDIS_SETTINGS = replace(REDIS_SETTINGS, conn_retries=0, conn_timeout=1)
+
+# Storage backend for this process; environment variables don't change at runtime
+STORAGE_PROVIDER = os.getenv("STORAGE_PROVIDER", "s3")
+
+# Probes arriving within this many seconds share one DB + storage check
+HEALTH_CACHE_TTL = 1.5
+# A hung database reports unhealthy after this many seconds instead of stalling probes
+DB_HEALTH_TIMEOUT = 1.0
+
+_health_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
+# Created on first use so it binds to the server's event loop
+_health_lock: Optional[asyncio.Lock] = None
+
+def _as_status(result: Any) -> Dict[str, Any]:
+    """Turn an exception from a gathered check into an unhealthy status"""
+    if isinstance(result, Exception):
+        return {"status": "unhealthy", "error": str(result)}
+    return result
+
+async def _cached_health(storage: StorageService, use_cache: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return (db_status, storage_status), reusing a check made in the last HEALTH_CACHE_TTL seconds"""
+    global _health_lock
+    if use_cache and time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL:
+        return _health_cache["value"]
+    
+    if _health_lock is None:
+        _health_lock = asyncio.Lock()
+    async with _health_lock:
+        # Another probe may have refreshed the cache while we waited
+        if use_cache and time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL:
+            return _health_cache["value"]
+        
+        db_status, storage_status = await asyncio.gather(
+            asyncio.wait_for(asyncio.to_thread(db_health_check), DB_HEALTH_TIMEOUT),
+            storage.health_check(),
+            return_exceptions=True
+        )
+        if isinstance(db_status, asyncio.TimeoutError):
+            db_status = {"status": "unhealthy", "error": "db timeout"}
+        db_status, storage_status = _as_status(db_status), _as_status(storage_status)
+        
+        _health_cache.update(ts=time.monotonic(), value=(db_status, storage_status))
+        return db_status, storage_status
+
 # Service startup and shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,10 +89,19 @@ async def lifespan(app: FastAPI):
         logger.info("Database initialized successfully")
         
         # Initialize storage service
-        storage_provider = os.getenv("STORAGE_PROVIDER", "s3")
-        storage_service = StorageService(provider=storage_provider)
-        await storage_service.health_check()
-        logger.info(f"Storage service ({storage_provider}) initialized successfully")
+        storage_service = StorageService(provider=STORAGE_PROVIDER)
+        await storage_service.startup()
+        await storage_service.verify()
+        app.state.storage = storage_service
+        logger.info(f"Storage service ({STORAGE_PROVIDER}) initialized successfully")
+        
+        # Connect to the job queue used for optimization/analysis processing
+        try:
+            app.state.arq_pool = await create_pool(API_REDIS_SETTINGS)
+            logger.info("Job queue connected successfully")
+        except Exception as e:
+            app.state.arq_pool = None
+            logger.warning(f"Job queue unavailable, processing in-process: {e}")
         
         logger.info("Resume Service started successfully")
         
@@ -50,159 +113,180 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Resume Service...")
+    if getattr(app.state, "arq_pool", None) is not None:
+        await app.state.arq_pool.close()
+    if getattr(app.state, "storage", None) is not None:
+        await app.state.storage.shutdown()
+    await close_clients()
 
 # Create FastAPI app
-app = FastAPI(
+fastapi_app = FastAPI(
     title="Resume Service API",
     version="1.0.0",
     description="Resume management microservice with S3/Railway storage integration",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
 # CORS middleware
-app.add_middleware(
+# "a.com, b.com" must not leave " b.com" unmatchable; a bare "*" takes
+# Starlette's allow-all path instead of a list scan
+_allowed_origins = os.getenv("ALLOWED_ORIGINS", "*")
+ALLOWED_ORIGINS = ["*"] if _allowed_origins.strip() == "*" else [
+    origin.strip() for origin in _allowed_origins.split(",") if origin.strip()
+]
+
+fastapi_app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv("ALLOWED_ORIGINS", "*").split(","),
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"],
     allow_headers=["*"],
 )
 
 # Include routers
-app.include_router(resume_routes.router, prefix="/api/v1")
+fastapi_app.include_router(resume_routes.router, prefix="/api/v1")
 
 # Global exception handlers
-@app.exception_handler(HTTPException)
+@fastapi_app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "status": "error",
             "message": exc.detail,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": request.url.path
         }
     )
 
-@app.exception_handler(RequestValidationError)
+@fastapi_app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "status": "error",
             "message": "Validation error",
             "errors": exc.errors(),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": request.url.path
         }
     )
 
-@app.exception_handler(ValidationError)
+@fastapi_app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "status": "error",
             "message": "Data validation error",
             "errors": exc.errors(),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": request.url.path
         }
     )
 
-@app.exception_handler(Exception)
+@fastapi_app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "status": "error",
             "message": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "path": request.url.path
         }
     )
 
 # Health check endpoints
-@app.get("/")
+# Everything in the root response but the timestamp, serialized once with the
+# closing brace dropped so the timestamp can be appended per request
+_ROOT_BODY_PREFIX = orjson.dumps({
+    "service": "Resume Service",
+    "version": "1.0.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "ready": "/health/ready",
+        "docs": "/docs",
+        "api": "/api/v1"
+    }
+})[:-1]
+
+@fastapi_app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "service": "Resume Service",
-        "version": "1.0.0",
-        "status": "running",
-        "timestamp": datetime.utcnow().isoformat(),
-        "endpoints": {
-            "health": "/health",
-            "docs": "/docs",
-            "api": "/api/v1"
-        }
-    }
+    timestamp = utc_now_iso().encode()
+    return Response(
+        content=b"".join((_ROOT_BODY_PREFIX, b',"timestamp":"', timestamp, b'"}')),
+        media_type="application/json"
+    )
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
+@fastapi_app.get("/health/ready", include_in_schema=False)
+async def readiness_check(
+    use_cache: bool = Query(True, alias="useCache"),
+    storage: StorageService = Depends(get_storage)
+):
+    """Readiness check against the database and storage; 503 when either is down"""
     try:
-        # Check database health
-        db_status = db_health_check()
-        
-        # Check storage health
-        storage_provider = os.getenv("STORAGE_PROVIDER", "s3")
-        storage_service = StorageService(provider=storage_provider)
-        storage_status = await storage_service.health_check()
+        db_status, storage_status = await _cached_health(storage, use_cache)
         
         # Determine overall status
         overall_status = "healthy"
         if db_status.get("status") != "healthy" or storage_status.get("status") != "healthy":
             overall_status = "unhealthy"
         
-        return {
-            "status": overall_status,
-            "timestamp": datetime.utcnow().isoformat(),
-            "services": {
-                "database": db_status,
-                "storage": storage_status
-            },
-            "version": "1.0.0"
-        }
+        return ORJSONResponse(
+            status_code=200 if overall_status == "healthy" else 503,
+            content={
+                "status": overall_status,
+                "timestamp": utc_now_iso(),
+                "services": {
+                    "database": db_status,
+                    "storage": storage_status
+                },
+                "version": "1.0.0"
+            }
+        )
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e),
-            "version": "1.0.0"
-        }
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "status": "unhealthy",
+                "timestamp": utc_now_iso(),
+                "error": str(e),
+                "version": "1.0.0"
+            }
+        )
 
-@app.get("/health/detailed")
-async def detailed_health_check():
+@fastapi_app.get("/health/detailed")
+async def detailed_health_check(
+    use_cache: bool = Query(True, alias="useCache"),
+    storage: StorageService = Depends(get_storage)
+):
     """Detailed health check with service information"""
     try:
-        # Database health
-        db_status = db_health_check()
-        
-        # Storage health
-        storage_provider = os.getenv("STORAGE_PROVIDER", "s3")
-        storage_service = StorageService(provider=storage_provider)
-        storage_status = await storage_service.health_check()
+        db_status, storage_status = await _cached_health(storage, use_cache)
         
         # Environment info
         env_info = {
             "environment": os.getenv("ENVIRONMENT", "development"),
-            "storage_provider": storage_provider,
+            "storage_provider": STORAGE_PROVIDER,
             "database_url": os.getenv("DATABASE_URL", "not_set")[:20] + "..." if os.getenv("DATABASE_URL") else "not_set"
         }
         
         return {
             "status": "healthy" if db_status.get("status") == "healthy" and storage_status.get("status") == "healthy" else "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "version": "1.0.0",
             "environment": env_info,
             "services": {
@@ -215,35 +299,38 @@ async def detailed_health_check():
         logger.error(f"Detailed health check failed: {e}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "error": str(e),
             "version": "1.0.0"
         }
 
 # Metrics endpoint
-@app.get("/metrics")
-async def get_metrics():
+# Scrapes within this many seconds are served the same serialized body
+METRICS_CACHE_TTL = 15.0
+
+_metrics_cache: Dict[str, Any] = {"ts": 0.0, "body": b""}
+
+@fastapi_app.get("/metrics")
+async def get_metrics(
+    refresh: bool = Query(False, description="Count files by listing storage instead of the database"),
+    storage: StorageService = Depends(get_storage)
+):
     """Get service metrics"""
     try:
-        from app.database import get_db_stats
-        
-        # Get database stats
-        db_stats = get_db_stats()
-        
-        # Get storage info
-        storage_provider = os.getenv("STORAGE_PROVIDER", "s3")
-        storage_service = StorageService(provider=storage_provider)
+        if not refresh and time.monotonic() - _metrics_cache["ts"] < METRICS_CACHE_TTL:
+            return Response(content=_metrics_cache["body"], media_type="application/json")
         
-        # Get file count from storage
-        files = await storage_service.list_files(prefix="resumes/", max_keys=1000)
+        # File counts come from the resume tables in one query; listing the
+        # bucket is O(files) and only used to reconcile on request
+        storage_stats = _list_storage_stats(storage) if refresh else asyncio.to_thread(get_storage_stats)
+        db_stats, storage_stats = await asyncio.gather(asyncio.to_thread(get_db_stats), storage_stats)
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
+        metrics = {
+            "timestamp": utc_now_iso(),
             "database": db_stats,
             "storage": {
-                "provider": storage_provider,
-                "files_count": len(files),
-                "total_size": sum(f.get("size", 0) for f in files)
+                "provider": STORAGE_PROVIDER,
+                **storage_stats
             },
             "service": {
                 "version": "1.0.0",
@@ -251,66 +338,83 @@ async def get_metrics():
             }
         }
         
+        # Serialize once; scrapes within the TTL get the cached bytes. Failed
+        # stats aren't cached so the next scrape retries them.
+        body = orjson.dumps(metrics)
+        if not refresh and "error" not in db_stats and "error" not in storage_stats:
+            _metrics_cache.update(ts=time.monotonic(), body=body)
+        return Response(content=body, media_type="application/json")
+        
     except Exception as e:
         logger.error(f"Failed to get metrics: {e}")
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
             "error": str(e)
         }
 
+async def _list_storage_stats(storage: StorageService) -> Dict[str, Any]:
+    """Count resume files and their total size by listing storage"""
+    files_count = total_size = 0
+    async for file_info in storage.list_files_iter(prefix="resumes/"):
+        files_count += 1
+        total_size += file_info.get("size", 0)
+    return {"files_count": files_count, "total_size": total_size}
+
 # API info endpoint
-@app.get("/api/info")
+_API_INFO_BODY = orjson.dumps({
+    "name": "Resume Service API",
+    "version": "1.0.0",
+    "description": "Resume management microservice with cloud storage integration",
+    "features": [
+        "Resume upload and storage",
+        "File processing and text extraction",
+        "Resume optimization",
+        "Resume analysis",
+        "Version control",
+        "Cloud storage integration (S3/Railway)"
+    ],
+    "endpoints": {
+        "resumes": "/api/v1/resumes",
+        "upload": "/api/v1/resumes/upload",
+        "optimization": "/api/v1/resumes/{id}/optimize",
+        "analysis": "/api/v1/resumes/{id}/analyze",
+        "versions": "/api/v1/resumes/{id}/versions",
+        "download": "/api/v1/resumes/{id}/download"
+    },
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc"
+    }
+})
+
+@fastapi_app.get("/api/info")
 async def api_info():
     """Get API information"""
-    return {
-        "name": "Resume Service API",
-        "version": "1.0.0",
-        "description": "Resume management microservice with cloud storage integration",
-        "features": [
-            "Resume upload and storage",
-            "File processing and text extraction",
-            "Resume optimization",
-            "Resume analysis",
-            "Version control",
-            "Cloud storage integration (S3/Railway)"
-        ],
-        "endpoints": {
-            "resumes": "/api/v1/resumes",
-            "upload": "/api/v1/resumes/upload",
-            "optimization": "/api/v1/resumes/{id}/optimize",
-            "analysis": "/api/v1/resumes/{id}/analyze",
-            "versions": "/api/v1/resumes/{id}/versions",
-            "download": "/api/v1/resumes/{id}/download"
-        },
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc"
-        }
-    }
+    return Response(content=_API_INFO_BODY, media_type="application/json")
 
 # Development endpoints (only in development mode)
 if os.getenv("ENVIRONMENT", "development").lower() == "development":
     
-    @app.get("/dev/db/stats")
+    @fastapi_app.get("/dev/db/stats")
     async def dev_db_stats():
         """Development endpoint to get database statistics"""
         try:
-            from app.database import get_db_stats
             return get_db_stats()
         except Exception as e:
             return {"error": str(e)}
     
-    @app.get("/dev/storage/files")
-    async def dev_storage_files():
+    @fastapi_app.get("/dev/storage/files")
+    async def dev_storage_files(storage: StorageService = Depends(get_storage)):
         """Development endpoint to list storage files"""
         try:
-            storage_provider = os.getenv("STORAGE_PROVIDER", "s3")
-            storage_service = StorageService(provider=storage_provider)
-            files = await storage_service.list_files(prefix="", max_keys=100)
+            files = await storage.list_files(prefix="", max_keys=100)
             return {"files": files, "count": len(files)}
         except Exception as e:
             return {"error": str(e)}
 
+# Liveness probes are answered ahead of the middleware stack; uvicorn serves main:app
+app = HealthCheckInterceptor(fastapi_app)
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -7,24 +7,51 @@ Handles feature development pipeline with automatic context updates and Git inte
 import os
 import sys
 import json
+import re
 import subprocess
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import argparse
+import importlib.util
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# (path, new content) for a documentation file, or None when it doesn't exist
+DocUpdate = Optional[Tuple[Path, str]]
+
+# Documentation edits, compiled once and applied in a single pass each
+_LAST_UPDATED_RE = re.compile(r"\*\*Last Updated\*\*: \d{4}-\d{2}-\d{2}")
+IN_PROGRESS_HEADING = "\n### 🔄 In Progress"
+# The working heading, at least one line of its body, then up to the next "### "
+_WORKING_SECTION_RE = re.compile(
+    r"### ✅ \*\*Working \(Verified\)\*\*.*\n.*\n(?:.*\n)*?(?=### )"
+)
 
 class RecruitlyDevWorkflow:
-    def __init__(self, project_root: str = None):
+    def __init__(self, project_root: str = None, test_workers: str = "auto"):
         self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.test_workers = test_workers
         self.docs_dir = self.project_root / "docs"
         self.scripts_dir = self.project_root / "scripts"
         self.augment_dir = self.project_root / ".augment"
         self.context_file = self.docs_dir / "DEVELOPMENT_CONTEXT.md"
         self.feature_log = self.docs_dir / "FEATURE_LOG.json"
+        # Progress updates appended since FEATURE_LOG.json was last written
+        self.feature_events = self.docs_dir / "FEATURE_EVENTS.jsonl"
         self.master_context = self.augment_dir / "MASTER_CONTEXT.md"
         self.roadmap_file = self.augment_dir / "ROADMAP.md"
+        # Parsed FEATURE_LOG.json, shared by every call in this run
+        self._features_cache: Optional[Dict] = None
 
-        # Ensure directories exist
+    def _ensure_dirs(self):
+        """Create the docs, scripts and .augment directories; only actions that write need them"""
         self.docs_dir.mkdir(exist_ok=True)
         self.scripts_dir.mkdir(exist_ok=True)
         self.augment_dir.mkdir(exist_ok=True)
@@ -32,6 +59,7 @@ class RecruitlyDevWorkflow:
     def start_feature(self, feature_name: str, description: str) -> Dict:
         """Start a new feature development cycle"""
         print(f"🚀 Starting feature: {feature_name}")
+        self._ensure_dirs()
 
         feature_data = {
             "name": feature_name,
@@ -58,32 +86,31 @@ class RecruitlyDevWorkflow:
     def update_feature_progress(self, feature_name: str, files_changed: List[str] = None,
                               tests_added: List[str] = None, notes: str = None):
         """Update feature development progress"""
+        self._ensure_dirs()
         features = self._load_feature_log()
 
         if feature_name not in features:
             print(f"❌ Feature '{feature_name}' not found")
             return
 
-        feature = features[feature_name]
-
-        if files_changed:
-            feature["files_changed"].extend(files_changed)
-        if tests_added:
-            feature["tests_added"].extend(tests_added)
-        if notes:
-            feature.setdefault("notes", []).append({
-                "timestamp": datetime.datetime.now().isoformat(),
-                "note": notes
-            })
-
-        feature["last_updated"] = datetime.datetime.now().isoformat()
+        # Append one event instead of rewriting the whole feature log
+        event = {
+            "feature": feature_name,
+            "ts": datetime.datetime.now().isoformat(),
+            "op": "progress",
+            "data": {"files_changed": files_changed, "tests_added": tests_added, "note": notes}
+        }
+        line = orjson.dumps(event) if ORJSON_AVAILABLE else json.dumps(event).encode()
+        with open(self.feature_events, "ab", buffering=0) as f:
+            f.write(line + b"\n")
 
-        self._save_feature_log(features)
+        self._apply_feature_event(features, event)
         print(f"📝 Updated progress for feature: {feature_name}")
 
     def complete_feature(self, feature_name: str, commit_message: str = None) -> bool:
         """Complete feature development and trigger automated workflow"""
         print(f"🎯 Completing feature: {feature_name}")
+        self._ensure_dirs()
 
         features = self._load_feature_log()
         if feature_name not in features:
@@ -92,22 +119,32 @@ class RecruitlyDevWorkflow:
 
         feature = features[feature_name]
 
+        # One clock read so every file records the same date, even across midnight
+        now = datetime.datetime.now()
+        today = now.strftime('%Y-%m-%d')
+
+        # Nothing to test or push: just record the completion
+        if not self._has_changes():
+            print("⚠️ No changes or unmerged commits; skipping tests, documentation and push")
+            feature["status"] = "completed"
+            feature["completion_time"] = now.isoformat()
+            self._save_feature_log(features)
+            return True
+
         # Run tests
         if not self._run_tests():
             print("❌ Tests failed. Feature completion aborted.")
             return False
 
-        # Update documentation
-        self._update_context_documentation(feature)
-
-        # Update Augment context
-        self._update_augment_context(feature)
-
-        # Update README status
-        self._update_readme_status(feature_name)
-
-        # Update roadmap
-        self._update_roadmap_progress(feature_name, feature)
+        # Stage every documentation edit in memory, then write them back to back
+        updates = [
+            self._update_context_documentation(feature, today),
+            self._update_augment_context(feature, today),
+            self._update_readme_status(feature_name, today),
+            self._update_roadmap_progress(feature_name, feature, today),
+        ]
+        for path, content in filter(None, updates):
+            path.write_text(content)
 
         # Commit changes
         commit_msg = commit_message or f"feat: {feature['description']}"
@@ -117,7 +154,7 @@ class RecruitlyDevWorkflow:
 
         # Mark feature as complete
         feature["status"] = "completed"
-        feature["completion_time"] = datetime.datetime.now().isoformat()
+        feature["completion_time"] = now.isoformat()
         self._save_feature_log(features)
 
         print(f"🎉 Feature '{feature_name}' completed successfully!")
@@ -128,21 +165,53 @@ class RecruitlyDevWorkflow:
 
         return True
 
+    def _has_changes(self) -> bool:
+        """Check for uncommitted changes or feature commits not yet merged into main"""
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True
+        )
+        # Outside a repository, assume there is work and let the full path decide
+        if status.returncode != 0 or status.stdout:
+            return True
+
+        # A clean tree can still carry commits made on feature/<name> by hand
+        ahead = subprocess.run(
+            ["git", "rev-list", "--count", "main..HEAD"],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True
+        )
+        return ahead.returncode != 0 or ahead.stdout.strip() != "0"
+
     def _run_tests(self) -> bool:
         """Run the test suite"""
         print("🧪 Running tests...")
 
-        # Backend tests
-        backend_result = self._run_command(
-            "python -m pytest",
-            cwd=self.project_root / "backend"
-        )
-
-        # Frontend tests
-        frontend_result = self._run_command(
-            "npm test -- --watchAll=false",
-            cwd=self.project_root / "frontend"
-        )
+        # Collect only tests/, stop on the first failure, and re-run last
+        # run's failures first from pytest's cache (.pytest_cache is gitignored)
+        backend_command = "python -m pytest tests -x --ff -q --durations=20"
+        # pytest-xdist lets the backend suite shard across cores; fall back to a
+        # single process when it isn't installed. Looked up here rather than at
+        # import so `status` doesn't pay for the sys.path scan.
+        if importlib.util.find_spec("xdist") is not None:
+            backend_command += f" -n {self.test_workers} --dist load"
+
+        # Backend and frontend suites touch disjoint trees, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backend = executor.submit(
+                self._run_command,
+                backend_command,
+                cwd=self.project_root / "backend"
+            )
+            frontend = executor.submit(
+                self._run_command,
+                "npm test -- --watchAll=false",
+                cwd=self.project_root / "frontend"
+            )
+            backend_result, frontend_result = backend.result(), frontend.result()
 
         if backend_result and frontend_result:
             print("✅ All tests passed")
@@ -151,8 +220,8 @@ class RecruitlyDevWorkflow:
             print("❌ Some tests failed")
             return False
 
-    def _update_context_documentation(self, feature: Dict):
-        """Update the development context documentation"""
+    def _update_context_documentation(self, feature: Dict, today: str) -> DocUpdate:
+        """Build the updated development context documentation"""
         print("📝 Updating context documentation...")
 
         # Read current context
@@ -164,135 +233,114 @@ class RecruitlyDevWorkflow:
         # Add feature to completed section
         feature_entry = f"- [x] {feature['name']}: {feature['description']}\n"
 
-        # Update the completed features section
+        # Update the completed features section, just above "In Progress"
         if "### ✅ Completed (Working 100%)" in content:
-            # Find the section and add the feature
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if line.startswith("### 🔄 In Progress"):
-                    lines.insert(i, feature_entry)
-                    break
-            content = '\n'.join(lines)
+            content = content.replace(
+                IN_PROGRESS_HEADING, f"\n{feature_entry}{IN_PROGRESS_HEADING[1:]}", 1
+            )
 
         # Update last modified timestamp
-        content = content.replace(
-            "**Last Updated**: 2025-08-26",
-            f"**Last Updated**: {datetime.datetime.now().strftime('%Y-%m-%d')}"
-        )
+        content = _LAST_UPDATED_RE.sub(f"**Last Updated**: {today}", content)
 
-        self.context_file.write_text(content)
         print("✅ Context documentation updated")
+        return self.context_file, content
 
-    def _update_readme_status(self, feature_name: str):
-        """Update README.md with latest status"""
+    def _update_readme_status(self, feature_name: str, today: str) -> DocUpdate:
+        """Build README.md with latest status"""
         readme_path = self.project_root / "README.md"
         if not readme_path.exists():
-            return
+            return None
 
         content = readme_path.read_text()
 
         # Update last updated timestamp
-        content = content.replace(
-            "**Last Updated**: 2025-08-26",
-            f"**Last Updated**: {datetime.datetime.now().strftime('%Y-%m-%d')}"
-        )
+        content = _LAST_UPDATED_RE.sub(f"**Last Updated**: {today}", content)
 
-        readme_path.write_text(content)
         print("✅ README.md updated")
+        return readme_path, content
 
-    def _update_augment_context(self, feature: Dict):
-        """Update Augment context files with feature completion"""
+    def _update_augment_context(self, feature: Dict, today: str) -> DocUpdate:
+        """Build the Augment master context with feature completion"""
         if not self.master_context.exists():
-            return
+            return None
 
         content = self.master_context.read_text()
 
         # Update last updated timestamp
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
-        content = content.replace(
-            "**Last Updated**: 2025-08-27",
-            f"**Last Updated**: {today}"
-        )
+        content = _LAST_UPDATED_RE.sub(f"**Last Updated**: {today}", content)
 
         # Add completed feature to working section
         feature_entry = f"- [x] {feature['name']}: {feature['description']}"
 
-        # Find the working section and add the feature
-        if "### ✅ **Working (Verified)**" in content:
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if "### ✅ **Working (Verified)**" in line:
-                    # Find the next section and insert before it
-                    for j in range(i + 1, len(lines)):
-                        if lines[j].startswith("### ") and j > i + 1:
-                            lines.insert(j, feature_entry)
-                            break
-                    break
-            content = '\n'.join(lines)
-
-        self.master_context.write_text(content)
+        # Insert before the next section heading after the working section
+        match = _WORKING_SECTION_RE.search(content)
+        if match:
+            content = f"{content[:match.end()]}{feature_entry}\n{content[match.end():]}"
+
         print("✅ Augment master context updated")
+        return self.master_context, content
 
-    def _update_roadmap_progress(self, feature_name: str, feature: Dict):
-        """Update roadmap with completed feature"""
+    def _update_roadmap_progress(self, feature_name: str, feature: Dict, today: str) -> DocUpdate:
+        """Build the roadmap with completed feature"""
         if not self.roadmap_file.exists():
-            return
+            return None
 
         content = self.roadmap_file.read_text()
 
         # Update last updated timestamp
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
-        content = content.replace(
-            "**Last Updated**: 2025-08-27",
-            f"**Last Updated**: {today}"
-        )
+        content = _LAST_UPDATED_RE.sub(f"**Last Updated**: {today}", content)
 
         # Mark feature as completed in roadmap
-        feature_pattern = f"- [ ] {feature_name}"
-        completed_pattern = f"- [x] {feature_name}"
-
-        if feature_pattern in content:
-            content = content.replace(feature_pattern, completed_pattern)
-
-        # Update progress indicators
-        if "🔄 **In Progress**" in content and feature_name in content:
-            # Move from in progress to completed
-            content = content.replace(
-                f"- [ ] {feature_name}",
-                f"- [x] {feature_name}"
-            )
+        content = content.replace(f"- [ ] {feature_name}", f"- [x] {feature_name}")
 
-        self.roadmap_file.write_text(content)
         print("✅ Roadmap updated")
+        return self.roadmap_file, content
 
     def _commit_and_push(self, feature_name: str, commit_message: str) -> bool:
         """Commit changes and push to GitHub"""
         print("📤 Committing and pushing changes...")
 
-        try:
-            # Add all changes
-            self._run_git_command("add .")
-
-            # Commit with message
-            self._run_git_command(f'commit -m "{commit_message}"')
-
-            # Push to origin
-            self._run_git_command(f"push origin feature/{feature_name}")
-
-            # Switch back to main and merge
-            self._run_git_command("checkout main")
-            self._run_git_command(f"merge feature/{feature_name}")
-            self._run_git_command("push origin main")
-
-            # Clean up feature branch
-            self._run_git_command(f"branch -d feature/{feature_name}")
-            self._run_git_command(f"push origin --delete feature/{feature_name}")
+        branch = f"feature/{feature_name}"
+
+        # Each step is an argv list run without a shell, so the commit message
+        # and branch name need no quoting on any platform. Main is fast-forwarded
+        # on origin straight from the feature branch, then the local main ref
+        # and HEAD follow it without checking out any files.
+        steps = [
+            ["add", "."],
+            ["commit", "-m", commit_message],
+            ["push", "origin", "HEAD:main"],
+            ["fetch", ".", "HEAD:main"],
+            ["symbolic-ref", "HEAD", "refs/heads/main"],
+            ["branch", "-D", branch],
+        ]
+        if not all(self._run_git_args(step) for step in steps):
+            print("ℹ️ If origin/main moved, rebase the feature branch onto it and retry")
+            return False
 
-            return True
+        # The feature branch is only on origin if someone pushed it by hand
+        remote = subprocess.run(
+            ["git", "ls-remote", "--exit-code", "--heads", "origin", branch],
+            cwd=self.project_root,
+            capture_output=True
+        )
+        if remote.returncode == 0:
+            return self._run_git_args(["push", "origin", "--delete", branch])
+        return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git operation failed: {e}")
+    def _run_git_args(self, args: List[str]) -> bool:
+        """Run a git command from an argument list, without a shell"""
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            print(f"Command failed: git {' '.join(args)}")
+            print(f"Error: {result.stderr}")
             return False
+        return True
 
     def _run_git_command(self, command: str):
         """Run a git command"""
@@ -317,14 +365,71 @@ class RecruitlyDevWorkflow:
             return False
 
     def _load_feature_log(self) -> Dict:
-        """Load the feature log"""
-        if self.feature_log.exists():
-            return json.loads(self.feature_log.read_text())
-        return {}
+        """Load the feature log snapshot plus pending progress events, parsing only on first use"""
+        if self._features_cache is None:
+            loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+            features = loads(self.feature_log.read_bytes()) if self.feature_log.exists() else {}
+            if self.feature_events.exists():
+                with open(self.feature_events, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            self._apply_feature_event(features, loads(line))
+            self._features_cache = features
+        return self._features_cache
 
     def _save_feature_log(self, features: Dict):
-        """Save the feature log"""
-        self.feature_log.write_text(json.dumps(features, indent=2))
+        """Save the feature log snapshot and drop the events it now contains"""
+        self._features_cache = features
+        if ORJSON_AVAILABLE:
+            # Keep the indented layout: the log is committed and read in diffs
+            self.feature_log.write_bytes(orjson.dumps(features, option=orjson.OPT_INDENT_2))
+        else:
+            self.feature_log.write_text(json.dumps(features, indent=2))
+        if self.feature_events.exists():
+            self.feature_events.unlink()
+
+    def compact_feature_log(self):
+        """Fold pending progress events into FEATURE_LOG.json"""
+        self._ensure_dirs()
+        self._save_feature_log(self._load_feature_log())
+        print("🗜️ Feature log compacted")
+
+    @staticmethod
+    def _apply_feature_event(features: Dict, event: Dict):
+        """Apply one progress event from FEATURE_EVENTS.jsonl to the feature log"""
+        feature = features.get(event["feature"])
+        if feature is None:
+            return
+
+        data = event["data"]
+        if data.get("files_changed"):
+            feature["files_changed"].extend(data["files_changed"])
+        if data.get("tests_added"):
+            feature["tests_added"].extend(data["tests_added"])
+        if data.get("note"):
+            feature.setdefault("notes", []).append({
+                "timestamp": event["ts"],
+                "note": data["note"]
+            })
+
+        feature["last_updated"] = event["ts"]
+
+    @staticmethod
+    def _parse_porcelain_v2(status: str) -> Tuple[str, int]:
+        """Return (branch, changed path count) from `git status --porcelain=v2 --branch -z`"""
+        branch = ""
+        modified_files = 0
+        entries = iter(status.split("\0"))
+        for entry in entries:
+            if entry.startswith("# branch.head "):
+                head = entry[len("# branch.head "):]
+                branch = "" if head == "(detached)" else head
+            elif entry[:1] in ("1", "2", "u", "?"):
+                modified_files += 1
+                if entry[0] == "2":
+                    # Renames and copies carry the original path as the next entry
+                    next(entries, None)
+        return branch, modified_files
 
     def show_project_status(self) -> Dict:
         """Show current project status"""
@@ -333,9 +438,10 @@ class RecruitlyDevWorkflow:
 
         # Git status
         try:
-            branch = subprocess.check_output(["git", "branch", "--show-current"], text=True).strip()
-            status = subprocess.check_output(["git", "status", "--porcelain"], text=True)
-            modified_files = len([line for line in status.split('\n') if line.strip()])
+            status = subprocess.check_output(
+                ["git", "status", "--porcelain=v2", "--branch", "-z"], text=True
+            )
+            branch, modified_files = self._parse_porcelain_v2(status)
 
             print(f"📝 Git Branch: {branch}")
             print(f"📁 Modified Files: {modified_files}")
@@ -384,7 +490,7 @@ class RecruitlyDevWorkflow:
 
 def main():
     parser = argparse.ArgumentParser(description="Recruitly Development Workflow")
-    parser.add_argument("action", choices=["start", "update", "complete", "status"],
+    parser.add_argument("action", choices=["start", "update", "complete", "status", "compact"],
                        help="Action to perform")
     parser.add_argument("--feature", help="Feature name")
     parser.add_argument("--description", help="Feature description")
@@ -392,10 +498,12 @@ def main():
     parser.add_argument("--tests", nargs="*", help="Tests added")
     parser.add_argument("--notes", help="Progress notes")
     parser.add_argument("--message", help="Commit message")
+    parser.add_argument("--workers", default="auto",
+                       help="pytest-xdist worker count for backend tests (default: auto)")
 
     args = parser.parse_args()
 
-    workflow = RecruitlyDevWorkflow()
+    workflow = RecruitlyDevWorkflow(test_workers=args.workers)
 
     if args.action == "start":
         if not args.feature or not args.description:
@@ -424,5 +532,8 @@ def main():
     elif args.action == "status":
         workflow.show_project_status()
 
+    elif args.action == "compact":
+        workflow.compact_feature_log()
+
 if __name__ == "__main__":
     main()